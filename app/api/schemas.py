@@ -29,6 +29,10 @@ class StoryCreateRequest(BaseModel):
     prompt_keywords: List[str] = Field(default_factory=list)
     image_source: Optional[str] = None
     voice_engine: Optional[str] = None
+    force_refresh: bool = Field(
+        default=False,
+        description="Regenerate the story even if an identical request was served recently.",
+    )
 
 
 class StoryResponse(StoryRecord):
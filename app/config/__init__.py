@@ -12,7 +12,7 @@ try:
 except ModuleNotFoundError:  # pragma: no cover
     import tomli as tomllib  # type: ignore
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 # Import Azure Key Vault integration (optional, will fail gracefully if not available)
 try:
@@ -95,6 +95,17 @@ class DatabaseSettings(BaseModel):
     url: str = "sqlite:///./stories.db"
 
 
+class PublishingSettings(BaseModel):
+    background: bool = False  # Save and upload stories on a worker thread after responding
+
+
+class CacheSettings(BaseModel):
+    curious_response_size: int = Field(default=0, ge=0)  # Curious LLM results to memoize; 0 disables
+    story_requests: bool = False  # Reuse a generated story for repeated identical requests
+    story_request_size: int = Field(default=128, ge=0)
+    story_request_ttl_seconds: float = Field(default=300.0, gt=0)
+
+
 class AppSettings(BaseModel):
     azure_api: AzureAPISettings
     dalle: DalleSettings = DalleSettings()  # Optional with defaults - ai_image is preferred
@@ -108,6 +119,8 @@ class AppSettings(BaseModel):
     azure_voice: AzureVoiceSettings | None = None
     voice_storage: VoiceStorageSettings | None = None
     database: DatabaseSettings = DatabaseSettings()
+    publishing: PublishingSettings = PublishingSettings()
+    cache: CacheSettings = CacheSettings()
 
 
 def _load_toml(path: Path) -> Dict[str, Any]:
@@ -191,6 +204,15 @@ def _env_override() -> Dict[str, Any]:
         "database": {
             "url": get_env_with_fallback("DATABASE_URL"),
         },
+        "publishing": {
+            "background": get_env_with_fallback("STORY_BACKGROUND_PUBLISH"),
+        },
+        "cache": {
+            "curious_response_size": get_env_with_fallback("CURIOUS_RESPONSE_CACHE_SIZE"),
+            "story_requests": get_env_with_fallback("STORY_REQUEST_CACHE"),
+            "story_request_size": get_env_with_fallback("STORY_REQUEST_CACHE_SIZE"),
+            "story_request_ttl_seconds": get_env_with_fallback("STORY_REQUEST_CACHE_TTL"),
+        },
     }
     # Filter out None values but keep empty strings (which are valid values)
     # Also include sections that have at least one non-None value
@@ -274,6 +296,15 @@ SECTION_MAPPING: Dict[str, Dict[str, str]] = {
     "database": {
         "DATABASE_URL": "url",
     },
+    "publishing": {
+        "STORY_BACKGROUND_PUBLISH": "background",
+    },
+    "cache": {
+        "CURIOUS_RESPONSE_CACHE_SIZE": "curious_response_size",
+        "STORY_REQUEST_CACHE": "story_requests",
+        "STORY_REQUEST_CACHE_SIZE": "story_request_size",
+        "STORY_REQUEST_CACHE_TTL": "story_request_ttl_seconds",
+    },
 }
 
 
@@ -379,6 +410,8 @@ __all__ = [
     "AzureVoiceSettings",
     "VoiceStorageSettings",
     "DatabaseSettings",
+    "PublishingSettings",
+    "CacheSettings",
     "get_settings",
     "load_settings",
 ]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID
@@ -203,7 +203,7 @@ class StoryRecord(BaseModel):
     prompt_curious: Optional[str] = Field(default=None, description="Prompt text used when generating curious content.")
     canurl: Optional[HttpUrl] = Field(default=None, description="Primary shareable URL.")
     canurl1: Optional[HttpUrl] = Field(default=None, description="Secondary shareable URL.")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Timestamp when the story was stored.")
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Timestamp when the story was stored.")
 
 
 class NarrativeResponse(BaseModel):
@@ -219,6 +219,11 @@ class CuriousNarrative(NarrativeResponse):
 
     explainability_notes: List[str] = Field(default_factory=list, description="Explainability notes per slide or section.")
     reasoning_trace: Optional[str] = Field(default=None, description="Optional reasoning trace provided by the LLM.")
+    parsed_output: Optional[Dict[str, Any]] = Field(
+        default=None,
+        exclude=True,
+        description="Structured JSON behind raw_output, kept so consumers need not re-parse it.",
+    )
 
 
 class NewsNarrative(NarrativeResponse):
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable, Protocol
+from typing import Iterable, Protocol, Sequence
 
 from .dto import (
     AnalysisReport,
@@ -129,3 +129,6 @@ class StoryRepository(Protocol):
     def get_by_canurl(self, canurl: str) -> StoryRecord:
         """Load a story record by its canonical URL (slug)."""
 
+    def get_by_canurls(self, canurls: Sequence[str]) -> StoryRecord:
+        """Load the story matching the earliest of several canonical URL candidates."""
+
@@ -65,6 +65,11 @@ async def startup_event():
     get_orchestrator()
     logger.warning("✅ Orchestrator initialized successfully")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Finish queued story publishing before the process exits."""
+    get_orchestrator().close()
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler to return detailed error messages."""
@@ -162,7 +167,11 @@ def get_orchestrator() -> StoryOrchestrator:
         )
     else:
         language_model = EchoLanguageModel()
-    curious_client = CuriousModelClient(language_model=language_model)
+    # Opt-in memoization of Curious LLM output for identical inputs (retries, duplicate URLs)
+    curious_client = CuriousModelClient(
+        language_model=language_model,
+        response_cache_size=settings.cache.curious_response_size,
+    )
     news_client = NewsModelClient(language_model=language_model)
     model_router = DefaultModelRouter({Mode.CURIOUS: curious_client, Mode.NEWS: news_client})
 
@@ -292,6 +301,10 @@ def get_orchestrator() -> StoryOrchestrator:
         default_voice_provider=default_voice_provider or "azure_basic",
         story_base_url=settings.aws.cdn_html_base,
         save_to_database=session_factory is not None,  # Enable database saving if database is available
+        background_publish=settings.publishing.background,
+        cache_identical_requests=settings.cache.story_requests,
+        request_cache_size=settings.cache.story_request_size,
+        request_cache_ttl=settings.cache.story_request_ttl_seconds,
     )
 
 
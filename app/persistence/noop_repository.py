@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Sequence
+
 from app.domain.dto import StoryRecord
 from app.domain.interfaces import StoryRepository
 
@@ -21,6 +23,10 @@ class NoOpStoryRepository(StoryRepository):
         """No-op: raise error since we don't store anything."""
         raise KeyError(f"Story with URL {canurl} not found (database not in use).")
 
+    def get_by_canurls(self, canurls: Sequence[str]) -> StoryRecord:
+        """No-op: raise error since we don't store anything."""
+        raise KeyError(f"Story with URLs {list(canurls)} not found (database not in use).")
+
 
 __all__ = ["NoOpStoryRepository"]
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
 from uuid import UUID
 
 from sqlalchemy import DateTime, Integer, JSON, String, Text
@@ -90,6 +90,36 @@ class SqlAlchemyStoryRepository(StoryRepository):
                 raise KeyError(f"Story with URL {canurl} not found.")
             return self._deserialize(orm)
 
+    def get_by_canurls(self, canurls: Sequence[str]) -> StoryRecord:
+        """Load the story matching the earliest candidate URL in a single query.
+
+        Each candidate is matched the same way as get_by_canurl; rows matching
+        an earlier candidate are preferred over rows matching a later one.
+        """
+        from sqlalchemy.orm import Session
+        from sqlalchemy import case, or_
+
+        if not canurls:
+            raise KeyError("Story not found: no URLs given.")
+
+        conditions = [
+            or_(
+                StoryORM.canurl == canurl,
+                StoryORM.canurl1 == canurl,
+                StoryORM.canurl.like(f"%{canurl}%"),
+                StoryORM.canurl1.like(f"%{canurl}%")
+            )
+            for canurl in canurls
+        ]
+        priority = case(*((condition, rank) for rank, condition in enumerate(conditions)), else_=len(conditions))
+
+        with self._session_factory() as session:  # type: Session
+            orm = session.query(StoryORM).filter(or_(*conditions)).order_by(priority).first()
+
+            if orm is None:
+                raise KeyError(f"Story with URLs {list(canurls)} not found.")
+            return self._deserialize(orm)
+
     def _serialize(self, record: StoryRecord) -> Dict[str, Any]:
         return {
             "id": str(record.id),
@@ -6,6 +6,7 @@ import base64
 import json
 import logging
 import re
+from datetime import timezone
 from pathlib import Path
 from typing import Optional
 from uuid import UUID
@@ -14,12 +15,16 @@ import httpx
 from pydantic import HttpUrl
 
 from app.domain.dto import ImageAsset, Mode, SlideBlock, SlideDeck, StoryRecord, VoiceAsset
-from app.services.template_slide_generators import get_slide_generator
+from app.services.template_slide_generators import SlideSpec, get_slide_generator
 from app.services.model_clients import LanguageModel
 
 
 class TemplateLoader:
-    """Load HTML templates from file system, S3, or URL."""
+    """Load HTML templates from file system, S3, or URL.
+
+    File templates ship with the app, so each one is read from disk once and
+    served from memory afterwards.
+    """
 
     def __init__(
         self,
@@ -28,6 +33,7 @@ class TemplateLoader:
     ) -> None:
         self._template_base_path = template_base_path or Path(__file__).parent.parent / "news_template"
         self._logger = logger or logging.getLogger(__name__)
+        self._file_cache: dict[tuple[str, Mode], str] = {}
 
     def load(self, template_key: str, mode: Mode, source: str = "file") -> str:
         """Load template from file system, S3, or URL."""
@@ -45,7 +51,16 @@ class TemplateLoader:
             return self._load_from_file(template_key, mode)
 
     def _load_from_file(self, template_key: str, mode: Mode) -> str:
-        """Load template from file system."""
+        """Load template from file system, reusing the cached copy when present."""
+        cache_key = (template_key, mode)
+        cached = self._file_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        template_html = self._read_template_file(template_key, mode)
+        self._file_cache[cache_key] = template_html
+        return template_html
+
+    def _read_template_file(self, template_key: str, mode: Mode) -> str:
         # If template_key is a URL, extract template name
         original_key = template_key
         if template_key.startswith(("http://", "https://")):
@@ -364,7 +379,10 @@ class PlaceholderMapper:
         placeholders["canurl"] = str(record.canurl) if record.canurl else ""
         placeholders["canurl1"] = str(record.canurl1) if record.canurl1 else ""
         # Timestamps - ISO 8601 format with Z suffix (e.g., "2025-01-21T10:30:00.000000Z")
-        iso_time = record.created_at.isoformat() + "Z"
+        created_at = record.created_at
+        if created_at.tzinfo is not None:
+            created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+        iso_time = created_at.isoformat() + "Z"
         placeholders["publishedtime"] = iso_time
         placeholders["modifiedtime"] = iso_time
         # Branding
@@ -882,16 +900,17 @@ class HTMLTemplateRenderer:
             if audio_idx < len(record.voice_assets):
                 audio_url = str(record.voice_assets[audio_idx].audio_url)
 
-            # Generate slide HTML using template-specific generator
-            slide_html = slide_generator.generate_slide(
-                paragraph=clean_text,
-                audio_url=audio_url,
-                background_image_url=image_url,
-                slide_id=f"slide-{idx}",
+            slides.append(
+                SlideSpec(
+                    paragraph=clean_text,
+                    audio_url=audio_url,
+                    background_image_url=image_url,
+                    slide_id=f"slide-{idx}",
+                )
             )
-            slides.append(slide_html)
 
-        return "\n".join(slides)
+        # Render the whole run with the template-specific generator in one join
+        return slide_generator.generate_deck(slides)
 
     def _cleanup_urls(self, html: str) -> str:
         """Remove stray curly braces from URLs."""
@@ -920,11 +939,15 @@ class HTMLTemplateRenderer:
 
     def save_html_to_file(
         self,
-        html_content: str,
+        html_content: str | bytes,
         story_id: UUID,
         output_dir: Optional[Path] = None,
     ) -> Path:
-        """Save rendered HTML to a local file."""
+        """Save rendered HTML to a local file.
+
+        Accepts already UTF-8 encoded bytes so callers that also upload the
+        document can encode it only once.
+        """
         try:
             if output_dir is None:
                 output_dir = Path("output")
@@ -937,7 +960,9 @@ class HTMLTemplateRenderer:
             output_path = output_dir / html_filename
             
             # Write file with proper error handling
-            output_path.write_text(html_content, encoding="utf-8")
+            if isinstance(html_content, str):
+                html_content = html_content.encode("utf-8")
+            output_path.write_bytes(html_content)
             self._logger.info("Saved HTML to file: %s", output_path)
             return output_path
         except PermissionError as e:
@@ -5,8 +5,12 @@ from __future__ import annotations
 import json
 import logging
 import re
-import textwrap
-from typing import Iterable, Optional, Protocol
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import accumulate, islice
+from typing import Iterable, Iterator, Optional, Protocol
 
 from app.domain.dto import (
     CuriousNarrative,
@@ -20,6 +24,23 @@ from app.domain.dto import (
     SlideDeck,
 )
 from app.domain.interfaces import ModelClient
+from app.utils import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Prefer orjson for (de)serializing model output; fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Aho-Corasick automata make the negative-keyword scan a single pass per sentence
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # Character limits per slide (matching Streamlit app)
 SLIDE_CHAR_LIMITS = {
@@ -31,6 +52,485 @@ SLIDE_CHAR_LIMITS = {
     "default": 200,
 }
 
+# Style suffix appended to Curious image prompts, and the cover prompt used when none can be derived
+GENERIC_ALT = (
+    "Flat vector illustration of the slide's idea; clean geometric shapes, "
+    "smooth gradients, harmonious palette; inclusive, family-friendly; "
+    "no text/logos/watermarks; no real-person likeness."
+)
+COVER_FALLBACK_ALT = f"Educational story cover illustration, welcoming, abstract, positive theme — {GENERIC_ALT}"
+
+# Upper bound on concurrent LLM calls while generating News slide narrations
+NARRATION_MAX_WORKERS = 8
+
+# Markdown-stripping patterns used by _strip_markdown and the clients' _clean_markdown
+_RE_BOLD = re.compile(r"\*\*([^*]+)\*\*")
+_RE_ITALIC = re.compile(r"\*([^*]+)\*")
+_RE_HEADER = re.compile(r"#+\s*")
+_RE_CODE = re.compile(r"`([^`]+)`")
+_RE_LINK = re.compile(r"\[([^\]]+)\]\([^\)]+\)")
+_RE_HR = re.compile(r"^---+$", re.MULTILINE)
+_RE_BLANKS = re.compile(r"\n\s*\n\s*\n+")
+_RE_WHITESPACE = re.compile(r"\s+")
+
+# Deletes unpaired * and ` left behind once the paired-markup patterns have run
+_MARKDOWN_RESIDUE_TABLE = str.maketrans("", "", "*`")
+
+# Sentence endings for . ! ? । (Devanagari) | (Bengali) | (Tamil) | (Telugu) | (Gujarati) | (Kannada) | (Malayalam) | (Gurmukhi)
+_RE_SENTENCE_END = re.compile(r"[.!?।।|॥]\s+")
+
+# JSON object wrapped in a ```json code fence
+_RE_JSON_CODE_FENCE = re.compile(r"```(?:json)?\s*(\{[\s\S]*?\})\s*```")
+
+# Topic words in article URL paths (numeric IDs and file extensions are not topics)
+_URL_WORD_RE = re.compile(r"[a-z]{4,}")
+
+
+def _json_loads(raw: str):
+    """Decode JSON text, using orjson when available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+    catching the stdlib exception type.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: dict) -> str:
+    """Encode a dict as compact, non-ASCII-escaped JSON text, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _parse_json_object(raw_output: str) -> dict:
+    """Parse a JSON object from an LLM response, tolerating code fences and extra text."""
+    # Try direct JSON parse
+    try:
+        return _json_loads(raw_output)
+    except json.JSONDecodeError:
+        pass
+
+    # Try the outermost {...} span (covers preambles and code fences) without a regex scan
+    start, end = raw_output.find("{"), raw_output.rfind("}")
+    if start != -1 and end > start:
+        try:
+            return _json_loads(raw_output[start:end + 1])
+        except json.JSONDecodeError:
+            pass
+
+    # Try to extract JSON from code fences
+    json_match = _RE_JSON_CODE_FENCE.search(raw_output)
+    if json_match:
+        try:
+            return _json_loads(json_match.group(1))
+        except json.JSONDecodeError:
+            pass
+
+    # Fallback: return empty structure
+    return {}
+
+
+def _strip_markdown(text: str, strip_rules: bool = False) -> str:
+    """Remove bold, italic, header, code and link markup (and ``---`` rules if asked).
+
+    Whitespace is left untouched; each client normalises it its own way.
+    """
+    # Plain text (the common case) needs no substitutions at all
+    if "*" in text or "#" in text or "`" in text or "[" in text or (strip_rules and "---" in text):
+        # Remove **bold**
+        text = _RE_BOLD.sub(r"\1", text)
+        # Remove *italic*
+        text = _RE_ITALIC.sub(r"\1", text)
+        # Remove # headers
+        text = _RE_HEADER.sub("", text)
+        # Remove `code blocks`
+        text = _RE_CODE.sub(r"\1", text)
+        # Remove [links](url)
+        text = _RE_LINK.sub(r"\1", text)
+        if strip_rules:
+            # Remove --- separators
+            text = _RE_HR.sub("", text)
+        # Remove stray * and ` in one C-level pass
+        text = text.translate(_MARKDOWN_RESIDUE_TABLE)
+    return text
+
+
+# Native script names for Curious mode language instructions
+CURIOUS_LANG_SCRIPT_MAP = {
+    "hi": "Devanagari script (हिंदी)",
+    "mr": "Devanagari script (मराठी)",
+    "gu": "Gujarati script (ગુજરાતી)",
+    "ta": "Tamil script (தமிழ்)",
+    "te": "Telugu script (తెలుగు)",
+    "kn": "Kannada script (ಕನ್ನಡ)",
+    "bn": "Bengali script (বাংলা)",
+    "pa": "Gurmukhi script (ਪੰਜਾਬੀ)",
+    "ur": "Urdu script (اردو)",
+    "or": "Odia script (ଓଡ଼ିଆ)",
+    "ml": "Malayalam script (മലയാളം)",
+}
+
+
+# Language codes to language names used in News mode prompts
+LANG_NAME_MAP = {
+    "hi": "Hindi",
+    "mr": "Marathi",
+    "gu": "Gujarati",
+    "ta": "Tamil",
+    "te": "Telugu",
+    "kn": "Kannada",
+    "bn": "Bengali",
+    "pa": "Punjabi",
+    "ur": "Urdu",
+    "or": "Odia",
+    "ml": "Malayalam",
+}
+
+
+# Language names to native script descriptions used in News mode prompts
+LANG_SCRIPT_BY_NAME = {
+    "Hindi": "Devanagari script (हिंदी)",
+    "Marathi": "Devanagari script (मराठी)",
+    "Gujarati": "Gujarati script (ગુજરાતી)",
+    "Tamil": "Tamil script (தமிழ்)",
+    "Telugu": "Telugu script (తెలుగు)",
+    "Kannada": "Kannada script (ಕನ್ನಡ)",
+    "Bengali": "Bengali script (বাংলা)",
+    "Punjabi": "Gurmukhi script (ਪੰਜਾਬੀ)",
+    "Urdu": "Urdu script (اردو)",
+    "Odia": "Odia script (ଓଡ଼ିଆ)",
+    "Malayalam": "Malayalam script (മലയാളം)",
+}
+
+
+# URL path segments that say nothing about an article's topic
+URL_SKIP_WORDS = frozenset({
+    'article', 'news', 'sports', 'cricket', 'football', 'cities',
+    'entertainment', 'technology', 'business', 'politics', 'world', 'html',
+})
+
+
+# Multilingual negative keywords used by NewsModelClient._filter_positive_content,
+# organized by script/language
+NEGATIVE_KEYWORDS = {
+    # English (Latin script)
+    'latin': frozenset({
+        'war', 'wars', 'warfare', 'battle', 'battles', 'attack', 'attacks', 'attacked', 'attacking',
+        'violence', 'violent', 'kill', 'killed', 'killing', 'death', 'deaths', 'dead', 'died', 'dying',
+        'bomb', 'bombs', 'bombing', 'bombed', 'explosion', 'explosions', 'exploded', 'terror', 'terrorist',
+        'terrorism', 'shooting', 'shot', 'gun', 'guns', 'weapon', 'weapons', 'murder', 'murdered',
+        'assassination', 'assassinated', 'riot', 'riots', 'protest', 'protests', 'blood', 'bloody',
+        'casualties', 'casualty', 'injured', 'injury', 'injuries', 'wounded', 'destruction', 'destroyed',
+        'destroy', 'destroys', 'damage', 'damaged', 'harm', 'harmed', 'crisis', 'crises', 'disaster',
+        'disasters', 'tragedy', 'tragedies', 'accident', 'accidents', 'crash', 'crashes', 'crashed',
+        'fire', 'fires', 'burning', 'burned', 'burnt', 'hate', 'hatred', 'hostile', 'hostility'
+    }),
+    # Hindi (Devanagari script) - Common negative words
+    'devanagari': frozenset({
+        'युद्ध', 'हिंसा', 'हत्या', 'मृत्यु', 'मौत', 'आतंक', 'आतंकवाद', 'हमला', 'हमले',
+        'नष्ट', 'तबाही', 'दुर्घटना', 'दुर्घटनाएं', 'खून', 'खूनी', 'हताहत', 'घायल',
+        'विनाश', 'नुकसान', 'क्षति', 'संकट', 'आपदा', 'त्रासदी', 'दुर्घटना', 'दुर्घटनाएं',
+        'आग', 'जलना', 'जला', 'नफरत', 'शत्रुता', 'शत्रुतापूर्ण'
+    }),
+    # Bengali
+    'bengali': frozenset({
+        'যুদ্ধ', 'হিংসা', 'হত্যা', 'মৃত্যু', 'মৃত্যু', 'সন্ত্রাস', 'সন্ত্রাসবাদ', 'আক্রমণ',
+        'ধ্বংস', 'বিপর্যয়', 'দুর্ঘটনা', 'রক্ত', 'রক্তাক্ত', 'হতাহত', 'আহত', 'ক্ষতি'
+    }),
+    # Tamil
+    'tamil': frozenset({
+        'போர்', 'வன்முறை', 'கொலை', 'மரணம்', 'பயங்கரவாதம்', 'தாக்குதல்', 'அழிவு',
+        'விபத்து', 'இரத்தம்', 'காயம்', 'சேதம்', 'நெருக்கடி', 'விபத்து'
+    }),
+    # Telugu
+    'telugu': frozenset({
+        'యుద్ధం', 'హింస', 'హత్య', 'మరణం', 'భయోత్పాతం', 'దాడి', 'వినాశనం',
+        'ప్రమాదం', 'రక్తం', 'గాయం', 'నష్టం', 'సంక్షోభం'
+    }),
+    # Gujarati
+    'gujarati': frozenset({
+        'યુદ્ધ', 'હિંસા', 'હત્યા', 'મૃત્યુ', 'આતંક', 'આતંકવાદ', 'હુમલો',
+        'નાશ', 'તબાહી', 'દુર્ઘટના', 'રક્ત', 'ઘાયલ', 'નુકસાન'
+    }),
+    # Kannada
+    'kannada': frozenset({
+        'ಯುದ್ಧ', 'ಹಿಂಸೆ', 'ಕೊಲೆ', 'ಮರಣ', 'ಭಯೋತ್ಪಾದನೆ', 'ದಾಳಿ', 'ವಿನಾಶ',
+        'ಅಪಘಾತ', 'ರಕ್ತ', 'ಗಾಯ', 'ನಷ್ಟ', 'ಸಂಕಷ್ಟ'
+    }),
+    # Malayalam
+    'malayalam': frozenset({
+        'യുദ്ധം', 'ഹിംസ', 'കൊല', 'മരണം', 'ഭീകരത', 'ആക്രമണം', 'വിനാശം',
+        'അപകടം', 'രക്തം', 'ഗായം', 'നഷ്ടം', 'സംക്ഷോഭം'
+    }),
+    # Punjabi (Gurmukhi)
+    'gurmukhi': frozenset({
+        'ਯੁੱਧ', 'ਹਿੰਸਾ', 'ਹੱਤਿਆ', 'ਮੌਤ', 'ਆਤੰਕ', 'ਹਮਲਾ', 'ਨਾਸ਼',
+        'ਤਬਾਹੀ', 'ਦੁਰਘਟਨਾ', 'ਖੂਨ', 'ਘਾਇਲ', 'ਨੁਕਸਾਨ'
+    }),
+    # Urdu (Arabic script) - Common negative words
+    'arabic': frozenset({
+        'جنگ', 'تشدد', 'قتل', 'موت', 'دہشت', 'دہشت گردی', 'حملہ', 'تباہی',
+        'حادثہ', 'خون', 'زخمی', 'نقصان', 'بحران'
+    }),
+    # Marathi (Devanagari - same script as Hindi, different words)
+    'marathi': frozenset({
+        'युद्ध', 'हिंसा', 'हत्या', 'मृत्यू', 'दहशत', 'हल्ला', 'नाश',
+        'तबाही', 'अपघात', 'रक्त', 'जखमी', 'नुकसान'
+    }),
+}
+
+
+# Scripts recognised by _detect_script, in tie-break order (first wins)
+_SCRIPTS = (
+    'latin', 'devanagari', 'bengali', 'tamil', 'telugu',
+    'gujarati', 'kannada', 'malayalam', 'gurmukhi', 'arabic',
+)
+
+# Unicode blocks are 128-codepoint aligned, so ``ord(char) >> 7`` identifies the block
+_SCRIPT_INDEX_BY_BLOCK = {
+    0x0000 >> 7: 0,  # ASCII/Latin
+    0x0900 >> 7: 1,  # Devanagari
+    0x0980 >> 7: 2,  # Bengali
+    0x0B80 >> 7: 3,  # Tamil
+    0x0C00 >> 7: 4,  # Telugu
+    0x0A80 >> 7: 5,  # Gujarati
+    0x0C80 >> 7: 6,  # Kannada
+    0x0D00 >> 7: 7,  # Malayalam
+    0x0A00 >> 7: 8,  # Gurmukhi
+    0x0600 >> 7: 9,  # Arabic (Urdu), first half
+    0x0680 >> 7: 9,  # Arabic (Urdu), second half
+}
+
+# The dominant script is decided from a sample of the text's leading characters
+_SCRIPT_SAMPLE_CHARS = 1024
+_SCRIPT_SAMPLE_CODEPOINTS = 256
+
+
+def _detect_script(text: str) -> str:
+    """Detect the primary script of text from up to 256 leading non-space characters."""
+    head = text[:_SCRIPT_SAMPLE_CHARS]
+    # Most articles are English: an all-ASCII head (an O(1) check in CPython) is all Latin
+    if head.isascii():
+        return 'latin'
+    sample = "".join(head.split())[:_SCRIPT_SAMPLE_CODEPOINTS]
+    counts = [0] * len(_SCRIPTS)
+    # Tally in C first so the block lookup runs once per distinct character
+    for char, occurrences in Counter(sample).items():
+        index = _SCRIPT_INDEX_BY_BLOCK.get(ord(char) >> 7)
+        if index is not None:
+            counts[index] += occurrences
+    best = max(range(len(_SCRIPTS)), key=counts.__getitem__)
+    return _SCRIPTS[best] if counts[best] > 0 else 'latin'
+
+
+def _build_negative_keyword_index() -> dict[str, tuple[str, ...]]:
+    """Lowercased native keywords to substring-match for each non-Latin script.
+
+    Very short keywords (≤ 2 characters) are skipped to avoid false positives.
+    English keywords are matched separately, as whole words.
+    """
+    return {
+        script: tuple(sorted({kw.lower() for kw in keywords if len(kw) > 2}))
+        for script, keywords in NEGATIVE_KEYWORDS.items()
+        if script != 'latin'
+    }
+
+
+NEGATIVE_KEYWORDS_BY_SCRIPT = _build_negative_keyword_index()
+
+# English keywords are whole words, so "award" or "software" do not match "war"
+_NEGATIVE_LATIN_WORDS = frozenset(kw.lower() for kw in NEGATIVE_KEYWORDS['latin'] if len(kw) > 2)
+_RE_LATIN_WORD = re.compile(r"[a-z]+")
+
+
+def _build_negative_automata() -> dict:
+    """Compile one Aho-Corasick automaton per script from NEGATIVE_KEYWORDS_BY_SCRIPT."""
+    automata = {}
+    for script, keywords in NEGATIVE_KEYWORDS_BY_SCRIPT.items():
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        automata[script] = automaton
+    return automata
+
+
+_NEGATIVE_AUTOMATA = _build_negative_automata() if AHOCORASICK_AVAILABLE else {}
+
+
+def _keyword_trie_pattern(keywords: Iterable[str]) -> "re.Pattern[str]":
+    """Compile keywords into one prefix-factored regex that finds any of them.
+
+    A flat ``a|b|c`` alternation retries every keyword at every position and is
+    slower than a plain ``in`` loop; sharing prefixes lets the engine discard
+    most keywords after one character. Keywords that extend a shorter keyword
+    are dropped since only the presence of a match matters.
+    """
+    trie: dict = {}
+    for keyword in sorted(keywords, key=len):
+        node = trie
+        for char in keyword:
+            if "" in node:
+                break
+            node = node.setdefault(char, {})
+        else:
+            node.clear()
+            node[""] = True
+
+    def emit(node: dict) -> str:
+        if "" in node:
+            return ""
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return re.compile(emit(trie))
+
+
+# Fallback when pyahocorasick is missing: one trie-shaped regex per script
+_NEGATIVE_PATTERNS = {
+    script: _keyword_trie_pattern(keywords)
+    for script, keywords in NEGATIVE_KEYWORDS_BY_SCRIPT.items()
+}
+
+
+def _contains_negative_keyword(sentence_lower: str, script: str) -> bool:
+    """Return True if the lowercased sentence contains a negative keyword for the script.
+
+    English words are checked for every script since mixed-language content is
+    common; native-script keywords are substring-matched because inflections
+    attach directly to the stem in those languages.
+    """
+    if not _NEGATIVE_LATIN_WORDS.isdisjoint(_RE_LATIN_WORD.findall(sentence_lower)):
+        return True
+    if script not in NEGATIVE_KEYWORDS_BY_SCRIPT:
+        return False
+    if AHOCORASICK_AVAILABLE:
+        return next(_NEGATIVE_AUTOMATA[script].iter(sentence_lower), None) is not None
+    return _NEGATIVE_PATTERNS[script].search(sentence_lower) is not None
+
+
+# Plain-text rule, stated once per prompt; the storytitle and narration calls carry it in their system prompts
+_NO_MARKDOWN_RULE = "Do NOT use markdown formatting (no **, no *, no #). Use plain text only."
+
+
+# Instruction block shared by every Curious request. It contains no per-request
+# values, so providers with automatic prefix caching (Azure OpenAI included) can
+# reuse it across languages and slide counts; the dynamic part is appended last.
+_CURIOUS_PROMPT_STATIC = f"""
+You are a multilingual teaching assistant.
+
+INPUT:
+- You will receive a topic or content to explain.
+- The target language and the exact slide count are given under REQUEST PARAMETERS at the end.
+
+MANDATORY LANGUAGE REQUIREMENTS:
+- Story content (storytitle, s1paragraph1, s2paragraph1, etc.) MUST be written in the target language.
+- If the target language is "hi", "mr", "gu", "ta", "te", "kn", "bn", "pa", "or", "ml", or "ur", use its native script (given under REQUEST PARAMETERS).
+- Image prompts (s0alt1, s1alt1, s2alt1, etc.) MUST ALWAYS be in ENGLISH ONLY, regardless of story language.
+- IMPORTANT: {_NO_MARKDOWN_RULE}
+- Generate EXACTLY the requested number of slides (s1paragraph1 through sNparagraph1, where N is the slide count).
+
+Your job:
+1) Extract a short and catchy title → storytitle (≤ 80 characters, plain text only, in the target language).
+2) Summarise the content into EXACTLY N slides (s1paragraph1..sNparagraph1), each within character limits:
+   - All story content must be in the target language and script.
+   - s1paragraph1: ≤ 500 characters
+   - s2paragraph1: ≤ 450 characters
+   - s3paragraph1: ≤ 400 characters
+   - s4paragraph1: ≤ 350 characters
+   - s5paragraph1: ≤ 300 characters
+   - s6paragraph1: ≤ 250 characters
+   - Additional slides: ≤ 250 characters each
+3) For each slide, write a DALL·E image prompt in ENGLISH ONLY (for image generation):
+   - Cover slide: s0alt1 (for the story title/cover) - MUST be in English
+   - Middle slides: s1alt1..sNalt1 (one for each content slide) - MUST be in English
+   - Image prompts must be in ENGLISH, even if story content is in another language
+   - Bright colors, clean lines, no text/captions/logos
+   - Flat vector illustration style
+   - Family-friendly and inclusive
+4) Keep content factual, educational, and accessible.
+
+SAFETY & POSITIVITY RULES:
+- If input includes unsafe themes, reinterpret to safe, inclusive, family-friendly content.
+- Image prompts must be safe, no real-person likeness, no text in images.
+
+CRITICAL: Respond strictly in the JSON format shown at the end:
+- Keys: Always in English
+- Story content values (storytitle, s1paragraph1, etc.): In the target language and script
+- Image prompt values (s0alt1, s1alt1, etc.): ALWAYS in English only
+""".strip()
+
+
+@lru_cache(maxsize=128)
+def _build_curious_system_prompt(target_lang: str, middle_count: int) -> str:
+    """Build the Curious mode system prompt (depends only on language and slide count)."""
+    # Determine script/language name for better instructions
+    script_info = CURIOUS_LANG_SCRIPT_MAP.get(target_lang, f"{target_lang} language")
+    
+    # JSON shape: the template always lists slides 1-6 and grows with middle_count beyond that
+    slide_numbers = range(1, max(6, middle_count) + 1)
+    json_fields = ",\n".join([
+        f'  "language": "{target_lang}"',
+        '  "storytitle": "..."',
+        '  "s0alt1": "..."',
+        *(f'  "s{i}paragraph1": "..."' for i in slide_numbers),
+        *(f'  "s{i}alt1": "..."' for i in slide_numbers),
+    ])
+    
+    return f"""{_CURIOUS_PROMPT_STATIC}
+
+REQUEST PARAMETERS:
+- Target language code = "{target_lang}"; write story content in {script_info}.
+- Slide count N = {middle_count}: generate EXACTLY {middle_count} slides (s1paragraph1 through s{middle_count}paragraph1, s1alt1 through s{middle_count}alt1).
+
+Include EXACTLY {middle_count} slides:
+
+{{
+{json_fields}
+}}"""
+
+
+def _truncate_text(text: str, limit: int) -> str:
+    """Cap whitespace-normalised text at limit characters, ending with "…" at a word boundary.
+
+    Falls back to a hard cut when the first word alone exceeds the limit
+    (e.g. unspaced scripts), where textwrap.shorten would return just "…".
+    """
+    if len(text) <= limit:
+        return text
+    head = text[:limit - 1]
+    if text[limit - 1] != " ":
+        boundary = head.rfind(" ")
+        if boundary > 0:
+            head = head[:boundary]
+    return head.rstrip() + "…"
+
+
+@lru_cache(maxsize=32)
+def _narration_language_fragments(content_language: str) -> tuple[str, str, str]:
+    """Return the (script_language, language_requirement, character_sketch) narration prompt parts."""
+    script_info = LANG_SCRIPT_BY_NAME.get(content_language, content_language)
+    
+    if content_language == "English":
+        script_language = "English"
+        language_requirement = "Deliver the narration strictly in English. Do not include words from other languages or transliteration."
+    else:
+        script_language = f"{content_language} (use {script_info})"
+        language_requirement = f"Deliver the narration strictly in {content_language} language using {script_info}. Do not use English or transliteration."
+    
+    character_sketch = (
+        f"Polaris is a sincere and articulate {content_language} news anchor. "
+        "They present facts clearly, concisely, and warmly, connecting deeply with their audience."
+    )
+    return script_language, language_requirement, character_sketch
+
+
+def _content_digest(text: str) -> str:
+    """Short, stable digest of (possibly multi-KB) text for use in cache keys."""
+    return blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
 
 class LanguageModel(Protocol):
     """Protocol describing minimal LLM behavior required by model clients."""
@@ -40,14 +540,8 @@ class LanguageModel(Protocol):
 
 
 def _aggregate_chunks(chunks: Iterable[SemanticChunk], limit: int = 3) -> str:
-    selected = []
-    for chunk in chunks:
-        if not chunk.text:
-            continue
-        selected.append(f"- {chunk.text.strip()}")
-        if len(selected) >= limit:
-            break
-    return "\n".join(selected)
+    bullets = (f"- {chunk.text.strip()}" for chunk in chunks if chunk.text)
+    return "\n".join(islice(bullets, limit))
 
 
 def _build_slide_deck(content_sections: list[str], template_key: str, language_code: str | None) -> SlideDeck:
@@ -91,9 +585,21 @@ class CuriousModelClient(ModelClient):
 
     mode: Mode = Mode.CURIOUS
 
-    def __init__(self, language_model: LanguageModel, template_key: str = "curious_default") -> None:
+    def __init__(
+        self,
+        language_model: LanguageModel,
+        template_key: str = "curious_default",
+        response_cache_size: int = 0,
+    ) -> None:
+        """
+        Args:
+            response_cache_size: Number of structured JSON results to memoize by
+                (source text, language, slide count). 0 (the default) disables the
+                cache, since LLM output is non-deterministic.
+        """
         self._language_model = language_model
         self._template_key = template_key
+        self._response_cache = LRUCache(response_cache_size) if response_cache_size > 0 else None
 
     def generate(
         self,
@@ -115,8 +621,6 @@ class CuriousModelClient(ModelClient):
         # Example: slide_count=7 means 1 cover + 5 middle + 1 CTA = 7
         # So middle_count = slide_count - 2
         # Ensure at least 1 middle slide, but respect the requested slide_count
-        import logging
-        logger = logging.getLogger(__name__)
         if slide_count:
             middle_count = max(1, slide_count - 2)  # At least 1 middle slide, but respect slide_count
             logger.info(f"Curious mode: slide_count={slide_count}, calculating middle_count={middle_count} (1 cover + {middle_count} middle + 1 CTA = {1 + middle_count + 1} total)")
@@ -133,21 +637,21 @@ class CuriousModelClient(ModelClient):
         # Build explainability notes
         explainability = self._build_explainability_notes(insights, slide_deck.slides)
         
+        # Serialize once; both fields carry the same compact JSON document.
+        serialized = _json_dumps(result_json)
         return CuriousNarrative(
             mode=self.mode,
             slide_deck=slide_deck,
-            raw_output=json.dumps(result_json, ensure_ascii=False, indent=2),
+            raw_output=serialized,
             explainability_notes=explainability,
-            reasoning_trace=json.dumps(result_json, ensure_ascii=False),
+            reasoning_trace=serialized,
+            parsed_output=result_json,
         )
 
     def _extract_source_text(self, insights: DocInsights) -> str:
         """Extract text from semantic chunks."""
-        chunks = []
-        for chunk in insights.semantic_chunks:
-            if chunk.text and chunk.text.strip():
-                chunks.append(chunk.text.strip())
-        return "\n\n".join(chunks) or "No content provided."
+        parts = [text for text in (chunk.text.strip() for chunk in insights.semantic_chunks if chunk.text) if text]
+        return "\n\n".join(parts) if parts else "No content provided."
 
     def _generate_structured_json(
         self,
@@ -157,107 +661,15 @@ class CuriousModelClient(ModelClient):
         prompt: RenderedPrompt,
     ) -> dict:
         """Generate structured JSON like streamlit app."""
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        # Build system prompt similar to streamlit app
-        # Determine script/language name for better instructions
-        lang_script_map = {
-            "hi": "Devanagari script (हिंदी)",
-            "mr": "Devanagari script (मराठी)",
-            "gu": "Gujarati script (ગુજરાતી)",
-            "ta": "Tamil script (தமிழ்)",
-            "te": "Telugu script (తెలుగు)",
-            "kn": "Kannada script (ಕನ್ನಡ)",
-            "bn": "Bengali script (বাংলা)",
-            "pa": "Gurmukhi script (ਪੰਜਾਬੀ)",
-            "ur": "Urdu script (اردو)",
-            "or": "Odia script (ଓଡ଼ିଆ)",
-            "ml": "Malayalam script (മലയാളം)",
-        }
-        script_info = lang_script_map.get(target_lang, f"{target_lang} language")
+        cache_key = None
+        if self._response_cache is not None:
+            cache_key = (_content_digest(source_text), target_lang, middle_count)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Curious mode: reusing cached structured JSON")
+                return dict(cached)
         
-        system_prompt = f"""
-You are a multilingual teaching assistant.
-
-INPUT:
-- You will receive a topic or content to explain.
-
-MANDATORY LANGUAGE REQUIREMENTS:
-- Target language code = "{target_lang}".
-- Story content (storytitle, s1paragraph1, s2paragraph1, etc.) MUST be written in {target_lang} language.
-- If target_lang is "hi", "mr", "gu", "ta", "te", "kn", "bn", "pa", "or", "ml", or "ur", use the appropriate native script ({script_info}).
-- Image prompts (s0alt1, s1alt1, s2alt1, etc.) MUST ALWAYS be in ENGLISH ONLY, regardless of story language.
-- IMPORTANT: Do NOT use markdown formatting (no **, no *, no #). Use plain text only.
-- Generate EXACTLY {middle_count} slides (s1paragraph1 through s{middle_count}paragraph1).
-
-Your job:
-1) Extract a short and catchy title → storytitle (≤ 80 characters, plain text only, in {target_lang} language).
-2) Summarise the content into EXACTLY {middle_count} slides (s1paragraph1..s{middle_count}paragraph1), each within character limits:
-   - All story content must be in {target_lang} language ({script_info}).
-   - s1paragraph1: ≤ 500 characters
-   - s2paragraph1: ≤ 450 characters
-   - s3paragraph1: ≤ 400 characters
-   - s4paragraph1: ≤ 350 characters
-   - s5paragraph1: ≤ 300 characters
-   - s6paragraph1: ≤ 250 characters
-   - Additional slides: ≤ 250 characters each
-3) For each slide, write a DALL·E image prompt in ENGLISH ONLY (for image generation):
-   - Cover slide: s0alt1 (for the story title/cover) - MUST be in English
-   - Middle slides: s1alt1..s{middle_count}alt1 (one for each content slide) - MUST be in English
-   - Image prompts must be in ENGLISH, even if story content is in {target_lang}
-   - Bright colors, clean lines, no text/captions/logos
-   - Flat vector illustration style
-   - Family-friendly and inclusive
-4) Keep content factual, educational, and accessible.
-
-SAFETY & POSITIVITY RULES:
-- If input includes unsafe themes, reinterpret to safe, inclusive, family-friendly content.
-- No markdown formatting - plain text only.
-- Image prompts must be safe, no real-person likeness, no text in images.
-
-CRITICAL: Respond strictly in this JSON format:
-- Keys: Always in English
-- Story content values (storytitle, s1paragraph1, etc.): In {target_lang} language ({script_info})
-- Image prompt values (s0alt1, s1alt1, etc.): ALWAYS in English only
-
-Include EXACTLY {middle_count} slides:
-
-{{
-  "language": "{target_lang}",
-  "storytitle": "...",
-  "s0alt1": "...",
-  "s1paragraph1": "...",
-  "s2paragraph1": "...",
-  "s3paragraph1": "...",
-  "s4paragraph1": "...",
-  "s5paragraph1": "...",
-  "s6paragraph1": "...",
-  "s1alt1": "...",
-  "s2alt1": "...",
-  "s3alt1": "...",
-  "s4alt1": "...",
-  "s5alt1": "...",
-  "s6alt1": "..."
-}}
-""".strip()
-        
-        # Add additional slide fields if needed
-        if middle_count > 6:
-            additional_paras = ",\n".join([f'  "s{i}paragraph1": "..."' for i in range(7, middle_count + 1)])
-            additional_alts = ",\n".join([f'  "s{i}alt1": "..."' for i in range(7, middle_count + 1)])
-            system_prompt = system_prompt.replace('  "s6paragraph1": "..."', f'  "s6paragraph1": "...",\n{additional_paras}')
-            system_prompt = system_prompt.replace('  "s6alt1": "..."', f'  "s6alt1": "...",\n{additional_alts}')
-        
-        # Ensure s0alt1 is always in the prompt (for cover slide)
-        if '"s0alt1": "..."' not in system_prompt:
-            # Insert s0alt1 after storytitle
-            system_prompt = system_prompt.replace('  "storytitle": "...",', '  "storytitle": "...",\n  "s0alt1": "...",')
-        
-        # Ensure s0alt1 is mentioned in the prompt for cover slide
-        if 's0alt1' not in system_prompt:
-            # Already added above in the JSON format, but ensure it's clear in instructions
-            pass
+        system_prompt = _build_curious_system_prompt(target_lang, middle_count)
         
         # Build user prompt
         user_prompt = f"""SOURCE INPUT:\n{source_text[:3000]}\n\nReturn only the JSON object described above. No markdown, no code fences, just valid JSON. Include EXACTLY {middle_count} slides."""
@@ -272,9 +684,10 @@ Include EXACTLY {middle_count} slides:
         
         # Parse JSON
         result = self._parse_json_response(raw_output)
+        parsed_ok = bool(result) and isinstance(result, dict)
         
         # If parsing failed, log and create minimal structure
-        if not result or not isinstance(result, dict):
+        if not parsed_ok:
             logger.warning(f"JSON parsing failed for Curious mode. Raw output preview: {raw_output[:500]}")
             result = {
                 "language": target_lang,
@@ -306,41 +719,16 @@ Include EXACTLY {middle_count} slides:
             result["s1paragraph1"] = result["storytitle"][:500]
         
         # Generate fallback alt texts if missing
-        GENERIC_ALT = (
-            "Flat vector illustration of the slide's idea; clean geometric shapes, "
-            "smooth gradients, harmonious palette; inclusive, family-friendly; "
-            "no text/logos/watermarks; no real-person likeness."
-        )
+        # CRITICAL: Non-English titles/content are converted to English descriptions for image prompts.
+        # Story content remains in the original language, only image prompts are converted.
+        # All missing alts are translated in one batched LLM call instead of one call per slide.
+        pending_translations: dict[str, str] = {}
         
         # Cover alt (s0alt1) - for cover slide (slides[0])
         if not result.get("s0alt1", "").strip():
             title = (result.get("storytitle") or "Educational Story").strip()
-            
-            # CRITICAL: Convert non-English title to English description for image prompt
-            # Story title remains in original language, only image prompt is converted
             if target_lang != "en":
-                try:
-                    # Generate English description from non-English title for image prompt
-                    title_desc_prompt = f"""Convert this story title to a brief English description for an image prompt (max 50 words).
-Title: {title}
-Original Language: {target_lang}
-
-Return only the English description that captures the visual essence of the story, no quotes or labels."""
-                    
-                    title_desc = self._language_model.complete(
-                        "You are a translator. Convert story titles to English descriptions for image generation.",
-                        title_desc_prompt
-                    ).strip().strip('"').strip("'")
-                    
-                    if title_desc and len(title_desc) > 10:
-                        result["s0alt1"] = f"Cover illustration for story about {title_desc}: welcoming, abstract, educational motif — {GENERIC_ALT}"
-                    else:
-                        # Fallback if conversion fails
-                        result["s0alt1"] = f"Educational story cover illustration, welcoming, abstract, positive theme — {GENERIC_ALT}"
-                except Exception as e:
-                    logger.warning(f"Failed to convert title to English for image prompt: {e}")
-                    # Fallback if LLM fails
-                    result["s0alt1"] = f"Educational story cover illustration, welcoming, abstract, positive theme — {GENERIC_ALT}"
+                pending_translations["s0"] = title
             else:
                 # English title - use directly
                 result["s0alt1"] = f"Cover for the story titled '{title}': welcoming, abstract, educational motif — {GENERIC_ALT}"
@@ -349,87 +737,81 @@ Return only the English description that captures the visual essence of the stor
         for i in range(1, middle_count + 1):
             if not result.get(f"s{i}alt1", "").strip():
                 seed = (result.get(f"s{i}paragraph1") or result.get("storytitle", "")).strip()
-                
-                # CRITICAL: Convert non-English content to English description for image prompt
-                # Story content (s{i}paragraph1) remains in original language, only image prompt is converted
                 if target_lang != "en" and seed:
-                    try:
-                        # Generate English description from non-English content for image prompt
-                        desc_prompt = f"""Convert this story content to a brief English description for an image prompt (max 30 words).
-Content: {seed[:200]}
-Original Language: {target_lang}
-
-Return only the English description that captures the visual essence, no quotes or labels."""
-                        
-                        english_desc = self._language_model.complete(
-                            "You are a translator. Convert story content to English descriptions for image generation.",
-                            desc_prompt
-                        ).strip().strip('"').strip("'")
-                        
-                        if english_desc and len(english_desc) > 10:
-                            result[f"s{i}alt1"] = f"{english_desc} — {GENERIC_ALT}"
-                        else:
-                            # Fallback if conversion fails
-                            result[f"s{i}alt1"] = GENERIC_ALT
-                    except Exception as e:
-                        logger.warning(f"Failed to convert slide {i} content to English for image prompt: {e}")
-                        # Fallback if LLM fails
-                        result[f"s{i}alt1"] = GENERIC_ALT
+                    pending_translations[f"s{i}"] = seed[:200]
                 else:
                     # English content - use directly
                     result[f"s{i}alt1"] = f"{seed} — {GENERIC_ALT}" if seed else GENERIC_ALT
         
+        if pending_translations:
+            descriptions = self._translate_alt_seeds(pending_translations, target_lang)
+            for slot in pending_translations:
+                english_desc = descriptions.get(slot, "")
+                valid = bool(english_desc) and len(english_desc) > 10
+                if slot == "s0":
+                    result["s0alt1"] = (
+                        f"Cover illustration for story about {english_desc}: welcoming, abstract, educational motif — {GENERIC_ALT}"
+                        if valid
+                        else COVER_FALLBACK_ALT
+                    )
+                else:
+                    result[f"{slot}alt1"] = f"{english_desc} — {GENERIC_ALT}" if valid else GENERIC_ALT
+        
         # Log final result
         logger.info(f"Curious mode generated {middle_count} middle slides + 1 cover = {middle_count + 1} total slides")
         logger.debug(f"Alt texts generated: {sum(1 for i in range(1, middle_count + 1) if result.get(f's{i}alt1'))} slides")
         
+        # Only cache real model output, never the parse-failure fallback
+        if cache_key is not None and parsed_ok:
+            self._response_cache.put(cache_key, dict(result))
+        
         return result
 
+    def _translate_alt_seeds(self, seeds: dict[str, str], target_lang: str) -> dict[str, str]:
+        """Translate story snippets to English image descriptions in one LLM call.
+
+        ``seeds`` maps slot names ("s0" for the cover, "s1".. for middle slides) to
+        the non-English text. Returns a mapping of slot to English description;
+        slots that could not be translated are omitted.
+        """
+        items = "\n".join(f"{slot}: {text}" for slot, text in seeds.items())
+        keys = ", ".join(f'"{slot}": "..."' for slot in seeds)
+        batch_prompt = f"""Convert each of these story snippets to a brief English description for an image prompt (max 30 words each; max 50 words for s0, the story title).
+Original Language: {target_lang}
+
+{items}
+
+Return only a JSON object mapping each key to its English description that captures the visual essence, no quotes or labels inside the descriptions:
+{{{keys}}}"""
+        try:
+            raw_output = self._language_model.complete(
+                "You are a translator. Convert story content to English descriptions for image generation.",
+                batch_prompt,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to convert content to English for image prompts: {e}")
+            return {}
+        
+        parsed = self._parse_json_response(raw_output)
+        if not isinstance(parsed, dict):
+            return {}
+        return {
+            slot: str(parsed[slot]).strip().strip('"').strip("'")
+            for slot in seeds
+            if parsed.get(slot)
+        }
+
     def _parse_json_response(self, raw_output: str) -> dict:
         """Parse JSON from model response, handling code fences and extra text."""
-        # Try direct JSON parse
-        try:
-            return json.loads(raw_output)
-        except json.JSONDecodeError:
-            pass
-        
-        # Try to extract JSON from code fences
-        json_match = re.search(r"```(?:json)?\s*(\{[\s\S]*\})\s*```", raw_output)
-        if json_match:
-            try:
-                return json.loads(json_match.group(1))
-            except json.JSONDecodeError:
-                pass
-        
-        # Try to find JSON object in text
-        json_match = re.search(r"\{[\s\S]*\}", raw_output)
-        if json_match:
-            try:
-                return json.loads(json_match.group(0))
-            except json.JSONDecodeError:
-                pass
-        
-        # Fallback: return empty structure
-        return {}
+        return _parse_json_object(raw_output)
 
     def _clean_markdown(self, text: str) -> str:
         """Remove markdown formatting from text."""
         if not text:
             return ""
-        # Remove **bold**
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-        # Remove *italic*
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)
-        # Remove # headers
-        text = re.sub(r'#+\s*', '', text)
-        # Remove `code blocks`
-        text = re.sub(r'`([^`]+)`', r'\1', text)
-        # Remove [links](url)
-        text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-        # Remove --- separators
-        text = re.sub(r'^---+$', '', text, flags=re.MULTILINE)
+        text = _strip_markdown(text, strip_rules=True)
         # Clean up extra whitespace
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+        text = _RE_BLANKS.sub("\n\n", text)
         return text.strip()
 
     def _build_slide_deck_from_json(self, result_json: dict, middle_count: int) -> SlideDeck:
@@ -448,46 +830,25 @@ Return only the English description that captures the visual essence, no quotes
         - slides[2] = second middle (s2paragraph1 → will map to s3paragraph1)
         - etc.
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        slides = []
+        # Exactly middle_count + 1 slides (cover + middle), filled by index
+        slides: list[SlideBlock] = [None] * (middle_count + 1)  # type: ignore
         
         # Cover slide (uses storytitle) - this becomes slides[0]
         storytitle = result_json.get("storytitle", "Educational Story")
-        slides.append(
-            SlideBlock(
-                placeholder_id="cover",  # Changed from "section_1" to avoid old code path
-                text=storytitle[:180],  # Limit cover text
-            )
+        slides[0] = SlideBlock(
+            placeholder_id="cover",  # Changed from "section_1" to avoid old code path
+            text=storytitle[:180],  # Limit cover text
         )
         
         # Middle slides (s1paragraph1 through s{middle_count}paragraph1)
         # These will be mapped to s2paragraph1, s3paragraph1, etc. by PlaceholderMapper
         for i in range(1, middle_count + 1):
-            key = f"s{i}paragraph1"
-            paragraph = result_json.get(key, "").strip()
-            slides.append(
-                SlideBlock(
-                    placeholder_id=f"slide_{i}",  # Changed from f"section_{i+1}" to avoid old code path
-                    text=paragraph if paragraph else f"Slide {i} content",
-                )
+            paragraph = (result_json.get(f"s{i}paragraph1") or "").strip()
+            slides[i] = SlideBlock(
+                placeholder_id=f"slide_{i}",  # Changed from f"section_{i+1}" to avoid old code path
+                text=paragraph if paragraph else f"Slide {i} content",
             )
         
-        # Ensure we have exactly middle_count + 1 slides (cover + middle)
-        expected_count = middle_count + 1
-        if len(slides) != expected_count:
-            logger.warning(f"Expected {expected_count} slides, got {len(slides)}. Adjusting...")
-            # Trim or pad to exact count
-            slides = slides[:expected_count]
-            while len(slides) < expected_count:
-                slides.append(
-                    SlideBlock(
-                        placeholder_id=f"slide_{len(slides)}",
-                        text="",
-                    )
-                )
-        
         logger.info(f"Built slide deck with {len(slides)} slides: 1 cover + {middle_count} middle")
         
         return SlideDeck(
@@ -498,13 +859,13 @@ Return only the English description that captures the visual essence, no quotes
 
     def _build_explainability_notes(self, insights: DocInsights, slides: list[SlideBlock]) -> list[str]:
         """Build explainability notes from slides."""
-        notes = []
-        for idx, slide in enumerate(slides):
-            source_chunk = ""
-            if idx < len(insights.semantic_chunks):
-                source_chunk = insights.semantic_chunks[idx].text[:120] if insights.semantic_chunks[idx].text else ""
-            notes.append(f"Slide {idx+1}: {slide.text[:120]} (Source: {source_chunk})")
-        return notes
+        chunks = insights.semantic_chunks
+        chunk_count = len(chunks)
+        return [
+            f"Slide {idx+1}: {slide.text[:120]} "
+            f"(Source: {chunks[idx].text[:120] if idx < chunk_count and chunks[idx].text else ''})"
+            for idx, slide in enumerate(slides)
+        ]
 
 
 class NewsModelClient(ModelClient):
@@ -530,6 +891,50 @@ class NewsModelClient(ModelClient):
         1. Generate slide structure (JSON format)
         2. Generate individual narrations for each slide
         """
+        stream = self._stream_narrations(prompt, insights, slide_count, category, subcategory, emotion)
+        # Headlines keep the storytitle as generated; the cover slide gets the cleaned one
+        storytitle = next(stream)
+        narrations = list(stream)
+        
+        # Build slide deck
+        slide_deck = _build_slide_deck(narrations, self._template_key, prompt.metadata.get("language", "en"))
+        
+        return NewsNarrative(
+            mode=self.mode,
+            slide_deck=slide_deck,
+            raw_output=f"Generated {len(narrations)} slides",
+            headlines=[storytitle],
+            bullet_points=narrations[1:],
+        )
+
+    def generate_stream(
+        self,
+        prompt: RenderedPrompt,
+        insights: DocInsights,
+        slide_count: Optional[int] = None,
+        category: Optional[str] = None,
+        subcategory: Optional[str] = None,
+        emotion: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Yield cleaned slide narrations in slide order as soon as each is ready.
+
+        The cover storytitle comes first, then one narration per middle slide.
+        Lets renderers show early slides while later narrations are in flight.
+        """
+        stream = self._stream_narrations(prompt, insights, slide_count, category, subcategory, emotion)
+        next(stream)  # The uncleaned storytitle only feeds NewsNarrative.headlines
+        yield from stream
+
+    def _stream_narrations(
+        self,
+        prompt: RenderedPrompt,
+        insights: DocInsights,
+        slide_count: Optional[int],
+        category: Optional[str],
+        subcategory: Optional[str],
+        emotion: Optional[str],
+    ) -> Iterator[str]:
+        """Yield the generated storytitle, then the cleaned slide narrations in order."""
         # Extract article text from semantic chunks
         article_text = self._extract_article_text(insights)
         
@@ -547,21 +952,17 @@ class NewsModelClient(ModelClient):
                 from urllib.parse import urlparse
                 parsed = urlparse(str(source_url))
                 path_parts = [p for p in parsed.path.split('/') if p and len(p) > 3]
-                url_keywords = []
-                skip_words = {'article', 'news', 'sports', 'cricket', 'football', 'cities', 
-                             'entertainment', 'technology', 'business', 'politics', 'world'}
-                
-                # Extract keywords from last 3 path segments
-                for part in path_parts[-3:]:
-                    words = part.split('-')
-                    for word in words:
-                        if len(word) > 3 and word.lower() not in skip_words:
-                            url_keywords.append(word.lower())
+                # Extract keywords (4+ letter words) from last 3 path segments
+                url_keywords = [
+                    word
+                    for word in _URL_WORD_RE.findall("/".join(path_parts[-3:]).lower())
+                    if word not in URL_SKIP_WORDS
+                ]
                 
                 if url_keywords:
                     unique_keywords = list(dict.fromkeys(url_keywords[:5]))  # Remove duplicates, keep first 5
                     url_context = f"\n\nCRITICAL INSTRUCTION: The article URL contains these keywords: {', '.join(unique_keywords)}. The generated story MUST be about this topic. DO NOT generate about Delhi pollution, air quality, or any unrelated topic. The URL is: {source_url}. Ensure the story title and content match the URL topic."
-                    logging.getLogger(__name__).warning(f"🔍 Added URL context to LLM: {unique_keywords}")
+                    logger.warning(f"🔍 Added URL context to LLM: {unique_keywords}")
         
         # Add URL context to article text to force correct topic generation
         if url_context:
@@ -571,73 +972,53 @@ class NewsModelClient(ModelClient):
         # Extract base language code (e.g., "hi" from "hi-IN")
         lang_code = language.split("-")[0] if "-" in language else language
         
-        # Map language codes to language names for prompts
-        lang_name_map = {
-            "hi": "Hindi",
-            "mr": "Marathi",
-            "gu": "Gujarati",
-            "ta": "Tamil",
-            "te": "Telugu",
-            "kn": "Kannada",
-            "bn": "Bengali",
-            "pa": "Punjabi",
-            "ur": "Urdu",
-            "or": "Odia",
-            "ml": "Malayalam",
-        }
-        content_language = lang_name_map.get(lang_code, "English")
+        content_language = LANG_NAME_MAP.get(lang_code, "English")
         
-        # Detect category, subcategory, emotion if not provided
-        if not category or not subcategory or not emotion:
-            detected_category, detected_subcategory, detected_emotion = self._detect_category_subcategory_emotion(
-                article_text, content_language
-            )
-            category = category or detected_category
-            subcategory = subcategory or detected_subcategory
-            emotion = emotion or detected_emotion
+        # Blank caller-supplied classification values count as missing and are inferred
+        category = (category or "").strip() or None
+        subcategory = (subcategory or "").strip() or None
+        emotion = (emotion or "").strip() or None
         
         # Calculate middle slides count
         middle_count = max(1, slide_count - 2) if slide_count else 5
         
-        # Phase 1: Generate slide structure (JSON format)
-        slides_structure = self._generate_slide_structure(
-            article_text, category, subcategory, emotion, content_language, middle_count
-        )
+        default_limit = SLIDE_CHAR_LIMITS.get("default", 200)
         
-        # Phase 2: Generate storytitle (cover slide)
-        storytitle = self._generate_storytitle(article_text, content_language, slide_count)
-        
-        # Phase 3: Generate individual narrations for each slide
-        narrations = []
-        slide_char_limits = SLIDE_CHAR_LIMITS.copy()
-        default_limit = slide_char_limits.get("default", 200)
-        
-        # Add storytitle as first slide - ensure it's never empty
-        cleaned_storytitle = self._clean_markdown(storytitle).strip()
-        if not cleaned_storytitle:
-            # Fallback: use first line of article or default
-            cleaned_storytitle = article_text.split("\n")[0].strip()[:80] if article_text else "Breaking News Story"
-        narrations.append(cleaned_storytitle)
-        
-        # Generate narrations for middle slides
-        for idx, slide_data in enumerate(slides_structure[:middle_count], start=1):
-            slide_index = idx + 1  # +1 because storytitle is slide 1
-            target_limit = slide_char_limits.get(slide_index, default_limit)
-            narration = self._generate_slide_narration(
-                slide_data, slide_index, content_language, target_limit
+        # The LLM calls below are independent, IO-bound HTTP requests, so they run on a thread pool
+        with ThreadPoolExecutor(max_workers=min(NARRATION_MAX_WORKERS, middle_count + 1)) as executor:
+            # Phase 1: Generate slide structure (JSON format), classifying the article
+            # in the same call when category, subcategory or emotion were not provided
+            # Phase 2: Generate storytitle (cover slide) - does not depend on the structure
+            structure_future = executor.submit(
+                self._generate_slide_structure,
+                article_text, category, subcategory, emotion, content_language, middle_count,
             )
-            narrations.append(self._clean_markdown(narration))
-        
-        # Build slide deck
-        slide_deck = _build_slide_deck(narrations, self._template_key, language)
-        
-        return NewsNarrative(
-            mode=self.mode,
-            slide_deck=slide_deck,
-            raw_output=f"Generated {len(narrations)} slides",
-            headlines=[storytitle],
-            bullet_points=narrations[1:] if len(narrations) > 1 else [],
-        )
+            storytitle_future = executor.submit(
+                self._generate_storytitle, article_text, content_language, slide_count
+            )
+            slides_structure = structure_future.result()
+            
+            # Phase 3: Generate individual narrations for each middle slide
+            # (slide_index + 1 because storytitle is slide 1); map preserves slide order
+            narration_tasks = [
+                (slide_data, idx + 1, content_language, SLIDE_CHAR_LIMITS.get(idx + 1, default_limit))
+                for idx, slide_data in enumerate(slides_structure[:middle_count], start=1)
+            ]
+            middle_narrations = executor.map(
+                lambda task: self._clean_markdown(self._generate_slide_narration(*task)),
+                narration_tasks,
+            )
+            storytitle = storytitle_future.result()
+            yield storytitle
+            
+            # Add storytitle as first slide - ensure it's never empty
+            cleaned_storytitle = self._clean_markdown(storytitle).strip()
+            if not cleaned_storytitle:
+                # Fallback: use first line of article or default
+                cleaned_storytitle = article_text.partition("\n")[0].strip()[:80] if article_text else "Breaking News Story"
+            yield cleaned_storytitle
+            # executor.map yields each narration as soon as it and all earlier ones are done
+            yield from middle_narrations
 
     def _filter_positive_content(self, text: str) -> str:
         """
@@ -648,134 +1029,17 @@ class NewsModelClient(ModelClient):
         if not text or len(text.strip()) < 50:
             return text
         
-        import re
-        logger = logging.getLogger(__name__)
-        
-        # MULTILINGUAL NEGATIVE KEYWORDS - Organized by script/language
-        negative_keywords = {
-            # English (Latin script)
-            'latin': [
-                'war', 'wars', 'warfare', 'battle', 'battles', 'attack', 'attacks', 'attacked', 'attacking',
-                'violence', 'violent', 'kill', 'killed', 'killing', 'death', 'deaths', 'dead', 'died', 'dying',
-                'bomb', 'bombs', 'bombing', 'bombed', 'explosion', 'explosions', 'exploded', 'terror', 'terrorist',
-                'terrorism', 'shooting', 'shot', 'gun', 'guns', 'weapon', 'weapons', 'murder', 'murdered',
-                'assassination', 'assassinated', 'riot', 'riots', 'protest', 'protests', 'blood', 'bloody',
-                'casualties', 'casualty', 'injured', 'injury', 'injuries', 'wounded', 'destruction', 'destroyed',
-                'destroy', 'destroys', 'damage', 'damaged', 'harm', 'harmed', 'crisis', 'crises', 'disaster',
-                'disasters', 'tragedy', 'tragedies', 'accident', 'accidents', 'crash', 'crashes', 'crashed',
-                'fire', 'fires', 'burning', 'burned', 'burnt', 'hate', 'hatred', 'hostile', 'hostility'
-            ],
-            # Hindi (Devanagari script) - Common negative words
-            'devanagari': [
-                'युद्ध', 'हिंसा', 'हत्या', 'मृत्यु', 'मौत', 'आतंक', 'आतंकवाद', 'हमला', 'हमले',
-                'नष्ट', 'तबाही', 'दुर्घटना', 'दुर्घटनाएं', 'खून', 'खूनी', 'हताहत', 'घायल',
-                'विनाश', 'नुकसान', 'क्षति', 'संकट', 'आपदा', 'त्रासदी', 'दुर्घटना', 'दुर्घटनाएं',
-                'आग', 'जलना', 'जला', 'नफरत', 'शत्रुता', 'शत्रुतापूर्ण'
-            ],
-            # Bengali
-            'bengali': [
-                'যুদ্ধ', 'হিংসা', 'হত্যা', 'মৃত্যু', 'মৃত্যু', 'সন্ত্রাস', 'সন্ত্রাসবাদ', 'আক্রমণ',
-                'ধ্বংস', 'বিপর্যয়', 'দুর্ঘটনা', 'রক্ত', 'রক্তাক্ত', 'হতাহত', 'আহত', 'ক্ষতি'
-            ],
-            # Tamil
-            'tamil': [
-                'போர்', 'வன்முறை', 'கொலை', 'மரணம்', 'பயங்கரவாதம்', 'தாக்குதல்', 'அழிவு',
-                'விபத்து', 'இரத்தம்', 'காயம்', 'சேதம்', 'நெருக்கடி', 'விபத்து'
-            ],
-            # Telugu
-            'telugu': [
-                'యుద్ధం', 'హింస', 'హత్య', 'మరణం', 'భయోత్పాతం', 'దాడి', 'వినాశనం',
-                'ప్రమాదం', 'రక్తం', 'గాయం', 'నష్టం', 'సంక్షోభం'
-            ],
-            # Gujarati
-            'gujarati': [
-                'યુદ્ધ', 'હિંસા', 'હત્યા', 'મૃત્યુ', 'આતંક', 'આતંકવાદ', 'હુમલો',
-                'નાશ', 'તબાહી', 'દુર્ઘટના', 'રક્ત', 'ઘાયલ', 'નુકસાન'
-            ],
-            # Kannada
-            'kannada': [
-                'ಯುದ್ಧ', 'ಹಿಂಸೆ', 'ಕೊಲೆ', 'ಮರಣ', 'ಭಯೋತ್ಪಾದನೆ', 'ದಾಳಿ', 'ವಿನಾಶ',
-                'ಅಪಘಾತ', 'ರಕ್ತ', 'ಗಾಯ', 'ನಷ್ಟ', 'ಸಂಕಷ್ಟ'
-            ],
-            # Malayalam
-            'malayalam': [
-                'യുദ്ധം', 'ഹിംസ', 'കൊല', 'മരണം', 'ഭീകരത', 'ആക്രമണം', 'വിനാശം',
-                'അപകടം', 'രക്തം', 'ഗായം', 'നഷ്ടം', 'സംക്ഷോഭം'
-            ],
-            # Punjabi (Gurmukhi)
-            'gurmukhi': [
-                'ਯੁੱਧ', 'ਹਿੰਸਾ', 'ਹੱਤਿਆ', 'ਮੌਤ', 'ਆਤੰਕ', 'ਹਮਲਾ', 'ਨਾਸ਼',
-                'ਤਬਾਹੀ', 'ਦੁਰਘਟਨਾ', 'ਖੂਨ', 'ਘਾਇਲ', 'ਨੁਕਸਾਨ'
-            ],
-            # Urdu (Arabic script) - Common negative words
-            'arabic': [
-                'جنگ', 'تشدد', 'قتل', 'موت', 'دہشت', 'دہشت گردی', 'حملہ', 'تباہی',
-                'حادثہ', 'خون', 'زخمی', 'نقصان', 'بحران'
-            ],
-            # Marathi (Devanagari - same script as Hindi, different words)
-            'marathi': [
-                'युद्ध', 'हिंसा', 'हत्या', 'मृत्यू', 'दहशत', 'हल्ला', 'नाश',
-                'तबाही', 'अपघात', 'रक्त', 'जखमी', 'नुकसान'
-            ]
-        }
-        
-        def detect_script(text: str) -> str:
-            """Detect the primary script used in text."""
-            script_counts = {
-                'latin': 0,
-                'devanagari': 0,
-                'bengali': 0,
-                'tamil': 0,
-                'telugu': 0,
-                'gujarati': 0,
-                'kannada': 0,
-                'malayalam': 0,
-                'gurmukhi': 0,
-                'arabic': 0
-            }
-            
-            for char in text:
-                code = ord(char)
-                if '\u0000' <= char <= '\u007F':  # ASCII/Latin
-                    script_counts['latin'] += 1
-                elif '\u0900' <= char <= '\u097F':  # Devanagari
-                    script_counts['devanagari'] += 1
-                elif '\u0980' <= char <= '\u09FF':  # Bengali
-                    script_counts['bengali'] += 1
-                elif '\u0B80' <= char <= '\u0BFF':  # Tamil
-                    script_counts['tamil'] += 1
-                elif '\u0C00' <= char <= '\u0C7F':  # Telugu
-                    script_counts['telugu'] += 1
-                elif '\u0A80' <= char <= '\u0AFF':  # Gujarati
-                    script_counts['gujarati'] += 1
-                elif '\u0C80' <= char <= '\u0CFF':  # Kannada
-                    script_counts['kannada'] += 1
-                elif '\u0D00' <= char <= '\u0D7F':  # Malayalam
-                    script_counts['malayalam'] += 1
-                elif '\u0A00' <= char <= '\u0A7F':  # Gurmukhi
-                    script_counts['gurmukhi'] += 1
-                elif '\u0600' <= char <= '\u06FF':  # Arabic (Urdu)
-                    script_counts['arabic'] += 1
-            
-            # Return script with highest count
-            detected_script = max(script_counts.items(), key=lambda x: x[1])[0]
-            return detected_script if script_counts[detected_script] > 0 else 'latin'
-        
         # Detect primary script
-        primary_script = detect_script(text)
+        primary_script = _detect_script(text)
         logger.info(f"🌐 Detected script: {primary_script}")
         
-        # Get negative keywords for detected script + always include English (common in mixed content)
-        keywords_to_check = set(negative_keywords.get(primary_script, []))
-        keywords_to_check.update(negative_keywords['latin'])  # Always check English too
-        
         # Split text into sentences (language-agnostic sentence splitting)
-        # Works for: . ! ? । (Devanagari) | (Bengali) | (Tamil) | (Telugu) | (Gujarati) | (Kannada) | (Malayalam) | (Gurmukhi)
-        sentence_endings = r'[.!?।।|॥]\s+'
-        sentences = re.split(sentence_endings, text)
+        sentences = _RE_SENTENCE_END.split(text)
         
         filtered_sentences = []
         filtered_count = 0
+        # Length of the '. '-joined result, tracked so the join only happens if it is kept
+        kept_chars = 0
         
         for sentence in sentences:
             sentence_stripped = sentence.strip()
@@ -784,83 +1048,35 @@ class NewsModelClient(ModelClient):
             
             sentence_lower = sentence_stripped.lower()
             
-            # Check if sentence contains any negative keywords
-            contains_negative = any(
-                keyword.lower() in sentence_lower 
-                for keyword in keywords_to_check 
-                if len(keyword) > 2  # Skip very short keywords to avoid false positives
-            )
-            
-            if not contains_negative:
+            # Check if sentence contains any negative keywords for the detected script (+ English)
+            if not _contains_negative_keyword(sentence_lower, primary_script):
+                if filtered_sentences:
+                    kept_chars += 2
+                kept_chars += len(sentence_stripped)
                 filtered_sentences.append(sentence_stripped)
             else:
                 filtered_count += 1
                 logger.debug(f"🚫 Filtered negative sentence: {sentence_stripped[:80]}...")
         
-        # Join filtered sentences
-        filtered_text = '. '.join(filtered_sentences)
-        
         # Safety check: If too much content was filtered (>70%), keep original (might be false positive)
-        filter_ratio = len(filtered_text) / len(text) if len(text) > 0 else 1.0
+        filter_ratio = kept_chars / len(text) if len(text) > 0 else 1.0
         if filter_ratio < 0.3:  # Less than 30% remaining
-            logger.warning(f"⚠️ Too much content filtered ({len(filtered_text)}/{len(text)} chars, {filter_ratio*100:.1f}%), keeping original to avoid false positives")
+            logger.warning(f"⚠️ Too much content filtered ({kept_chars}/{len(text)} chars, {filter_ratio*100:.1f}%), keeping original to avoid false positives")
             return text
         
+        # Join filtered sentences
+        filtered_text = '. '.join(filtered_sentences)
+        
         if filtered_count > 0:
-            logger.info(f"✅ Filtered {filtered_count} negative sentences: {len(text)} → {len(filtered_text)} chars ({filter_ratio*100:.1f}% kept)")
+            logger.info(f"✅ Filtered {filtered_count} negative sentences: {len(text)} → {kept_chars} chars ({filter_ratio*100:.1f}% kept)")
         else:
-            logger.debug(f"✅ No negative content detected, keeping original text")
+            logger.debug("✅ No negative content detected, keeping original text")
         
         return filtered_text if filtered_text else text
 
     def _extract_article_text(self, insights: DocInsights) -> str:
         """Extract full article text from semantic chunks."""
-        text_parts = []
-        for chunk in insights.semantic_chunks:
-            if chunk.text:
-                text_parts.append(chunk.text.strip())
-        return "\n\n".join(text_parts) or "No article content available."
-
-    def _detect_category_subcategory_emotion(self, article_text: str, content_language: str) -> tuple[str, str, str]:
-        """Detect category, subcategory, and emotion from article text (like Streamlit app)."""
-        if not article_text or len(article_text.strip()) < 50:
-            return ("News", "General", "Neutral")
-        
-        # Use English for category detection (more reliable for JSON parsing)
-        # But we'll generate content in the target language
-        prompt = f"""
-You are an expert news analyst.
-
-Analyze the following news article and return:
-
-1. category
-2. subcategory
-3. emotion
-
-Article:
-\"\"\"{article_text[:3000]}\"\"\"
-
-Return ONLY as JSON:
-{{
-  "category": "...",
-  "subcategory": "...",
-  "emotion": "..."
-}}
-"""
-        
-        try:
-            system_prompt = "Classify the news into category, subcategory, and emotion. Return only valid JSON."
-            response = self._language_model.complete(system_prompt, prompt.strip())
-            content = response.strip()
-            content = content.strip("```json").strip("```").strip()
-            
-            result = json.loads(content)
-            if all(k in result for k in ["category", "subcategory", "emotion"]):
-                return (result["category"], result["subcategory"], result["emotion"])
-        except Exception:
-            pass
-        
-        return ("News", "General", "Neutral")
+        return "\n\n".join(chunk.text.strip() for chunk in insights.semantic_chunks if chunk.text) or "No article content available."
 
     def _generate_slide_structure(
         self,
@@ -871,7 +1087,11 @@ Return ONLY as JSON:
         content_language: str,
         middle_count: int,
     ) -> list[dict]:
-        """Phase 1: Generate slide structure in JSON format."""
+        """Phase 1: Generate slide structure in JSON format.
+
+        Any missing category, subcategory or emotion is inferred by the model in
+        this same call instead of a separate classification round-trip.
+        """
         guidance_map = {
             2: "detail the core development with precise names, locations, and the headline claim.",
             3: "explain earlier context, build-up, or precedent events that shaped the story.",
@@ -902,6 +1122,16 @@ Return ONLY as JSON:
                 "IMPORTANT: image_prompt field MUST be in ENGLISH ONLY for image generation."
             )
         
+        classify = not (category and subcategory and emotion)
+        if classify:
+            classify_clause = (
+                "\n- Before writing the slides, classify the article's category, subcategory, and emotion "
+                "(in English) and keep the slides' tone consistent with them."
+            )
+            classify_fields = '\n  "category": "...",\n  "subcategory": "...",\n  "emotion": "...",'
+        else:
+            classify_clause = classify_fields = ""
+        
         system_prompt = f"""
 Create an engaging Google Web Story based on the news article provided below.
 
@@ -912,7 +1142,7 @@ Objectives:
 - Provide slide-wise captions and background image suggestions that align with each phase of the story.
 - Maintain chronological flow: introduction → build-up → evidence → reactions → implications → outlook.
 - Avoid repetition; each slide must surface fresh details pulled from different portions of the article.
-- IMPORTANT: Do NOT use markdown formatting (no **, no *, no #). Use plain text only.
+- IMPORTANT: {_NO_MARKDOWN_RULE}{classify_clause}
 
 Language requirements:
 - {language_clause}
@@ -920,11 +1150,11 @@ Language requirements:
 - image_prompt field MUST ALWAYS be in English (for DALL-E image generation).
 
 Return JSON strictly in this format (NO markdown, NO code fences):
-{{
+{{{classify_fields}
   "slides": [
     {{
-      "title": "<concise slide caption (≤ 90 characters, plain text only)>",
-      "summary": "<two or three sentences covering the facts for narration, plain text only>",
+      "title": "<concise slide caption (≤ 90 characters)>",
+      "summary": "<two or three sentences covering the facts for narration>",
       "image_prompt": "<background or visual suggestion relevant to this slide>"
     }},
     ...
@@ -933,9 +1163,9 @@ Return JSON strictly in this format (NO markdown, NO code fences):
 """
         
         user_prompt = f"""
-Category: {category or "News"}
-Subcategory: {subcategory or "General"}
-Emotion: {emotion or "Neutral"}
+Category: {category or "infer from the article"}
+Subcategory: {subcategory or "infer from the article"}
+Emotion: {emotion or "infer from the article"}
 
 Article:
 \"\"\"{article_text[:3000]}\"\"\"
@@ -946,97 +1176,81 @@ Guidance:
         
         try:
             raw_output = self._language_model.complete(system_prompt, user_prompt)
-            # Clean JSON response
-            raw_output = raw_output.strip()
-            raw_output = raw_output.strip("```json").strip("```").strip()
-            
-            # Parse JSON
-            parsed = json.loads(raw_output)
+            parsed = _parse_json_object(raw_output)
             slides_raw = parsed.get("slides", [])
+            if classify:
+                logger.debug(
+                    "Detected classification: %s / %s / %s",
+                    parsed.get("category"), parsed.get("subcategory"), parsed.get("emotion"),
+                )
             
             if not slides_raw:
                 # Fallback: generate simple slides from article text
                 return self._fallback_slide_generation(article_text, middle_count)
             
             return slides_raw
-        except (json.JSONDecodeError, KeyError, Exception) as e:
+        except (json.JSONDecodeError, KeyError, Exception):
             # Fallback if JSON parsing fails
             return self._fallback_slide_generation(article_text, middle_count)
 
     def _fallback_slide_generation(self, article_text: str, middle_count: int) -> list[dict]:
         """Fallback: Generate simple slides from article text."""
         sentences = article_text.split(". ")
+        # Offset of each sentence in article_text, so slides are sliced out rather than re-joined
+        offsets = list(accumulate((len(sentence) + 2 for sentence in sentences), initial=0))
         slides = []
         sentences_per_slide = max(1, len(sentences) // middle_count)
         
         for i in range(middle_count):
             start_idx = i * sentences_per_slide
             end_idx = min(start_idx + sentences_per_slide, len(sentences))
-            slide_text = ". ".join(sentences[start_idx:end_idx])
+            if start_idx >= end_idx:
+                continue
+            # Only the first 300 characters are used, and end offsets exclude the trailing ". "
+            start = offsets[start_idx]
+            slide_text = article_text[start:min(offsets[end_idx] - 2, start + 300)]
             if slide_text:
                 slides.append({
                     "title": slide_text[:90],
-                    "summary": slide_text[:300],
+                    "summary": slide_text,
                     "image_prompt": "News story background"
                 })
         
-        return slides[:middle_count]
+        return slides
 
     def _generate_storytitle(self, article_text: str, content_language: str, slide_count: Optional[int]) -> str:
         """Generate storytitle (cover slide narration)."""
-        headline = article_text.split("\n")[0].strip().replace('"', '')
+        headline = article_text.partition("\n")[0].strip().replace('"', '')
         if not headline:
             headline = article_text[:100].strip()
         
         slide1_limit = SLIDE_CHAR_LIMITS.get(1, 80)
         
-        # Map language names to script information for storytitle
-        script_map_title = {
-            "Hindi": "Devanagari script (हिंदी)",
-            "Marathi": "Devanagari script (मराठी)",
-            "Gujarati": "Gujarati script (ગુજરાતી)",
-            "Tamil": "Tamil script (தமிழ்)",
-            "Telugu": "Telugu script (తెలుగు)",
-            "Kannada": "Kannada script (ಕನ್ನಡ)",
-            "Bengali": "Bengali script (বাংলা)",
-            "Punjabi": "Gurmukhi script (ਪੰਜਾਬੀ)",
-            "Urdu": "Urdu script (اردو)",
-            "Odia": "Odia script (ଓଡ଼ିଆ)",
-            "Malayalam": "Malayalam script (മലയാളം)",
-        }
-        script_info_title = script_map_title.get(content_language, content_language)
+        script_info_title = LANG_SCRIPT_BY_NAME.get(content_language, content_language)
         
         if content_language == "English":
             slide1_prompt = (
                 f"Generate headline intro narration in English for: {headline}. "
-                f"Maximum {slide1_limit} characters. Avoid greetings. Respond in English only, translating the source if necessary. "
-                f"Do NOT use markdown formatting (no **, no *, no #). Use plain text only."
+                f"Maximum {slide1_limit} characters. Avoid greetings. Respond in English only, translating the source if necessary."
             )
         else:
             slide1_prompt = (
                 f"Generate news headline narration in {content_language} for the story: {headline}. "
-                f"Maximum {slide1_limit} characters. Avoid greetings. Respond in {content_language} language using {script_info_title} only. "
-                f"Do NOT use markdown formatting (no **, no *, no #). Use plain text only."
+                f"Maximum {slide1_limit} characters. Avoid greetings. Respond in {content_language} language using {script_info_title} only."
             )
         
         try:
             system_prompt = "You are a news presenter generating opening lines. Always respond with plain text only, no markdown."
             response = self._language_model.complete(system_prompt, slide1_prompt)
-            storytitle = textwrap.shorten(
-                self._clean_markdown(response.strip()),
-                width=slide1_limit,
-                placeholder="…"
-            )
+            storytitle = _truncate_text(self._clean_markdown(response.strip()), slide1_limit)
             # Ensure we always return a non-empty storytitle
             if not storytitle or not storytitle.strip():
                 storytitle = headline[:slide1_limit] if headline else "Breaking News Story"
             return storytitle.strip()
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).warning("Storytitle generation failed: %s, using fallback", e)
+            logger.warning("Storytitle generation failed: %s, using fallback", e)
             # Always return a fallback - never empty
             return headline[:slide1_limit] if headline else "Breaking News Story"
-            return headline[:80]
 
     def _generate_slide_narration(
         self,
@@ -1053,40 +1267,12 @@ Guidance:
         if not summary_brief:
             summary_brief = caption or "Provide factual narration for this segment."
         
-        # Map language names to script information
-        script_map = {
-            "Hindi": "Devanagari script (हिंदी)",
-            "Marathi": "Devanagari script (मराठी)",
-            "Gujarati": "Gujarati script (ગુજરાતી)",
-            "Tamil": "Tamil script (தமிழ்)",
-            "Telugu": "Telugu script (తెలుగు)",
-            "Kannada": "Kannada script (ಕನ್ನಡ)",
-            "Bengali": "Bengali script (বাংলা)",
-            "Punjabi": "Gurmukhi script (ਪੰਜਾਬੀ)",
-            "Urdu": "Urdu script (اردو)",
-            "Odia": "Odia script (ଓଡ଼ିଆ)",
-            "Malayalam": "Malayalam script (മലയാളം)",
-        }
-        script_info = script_map.get(content_language, content_language)
-        
-        if content_language == "English":
-            script_language = "English"
-            language_requirement = "Deliver the narration strictly in English. Do not include words from other languages or transliteration."
-        else:
-            script_language = f"{content_language} (use {script_info})"
-            language_requirement = f"Deliver the narration strictly in {content_language} language using {script_info}. Do not use English or transliteration."
-        
-        character_sketch = (
-            f"Polaris is a sincere and articulate {content_language} news anchor. "
-            "They present facts clearly, concisely, and warmly, connecting deeply with their audience."
-        )
+        script_language, language_requirement, character_sketch = _narration_language_fragments(content_language)
         
         narration_prompt = f"""
 Write a narration in {script_language} (max {target_limit} characters),
 in the voice of Polaris (factual, vivid, and neutral). {language_requirement}
 
-IMPORTANT: Do NOT use markdown formatting (no **, no *, no #). Use plain text only.
-
 Key points to cover:
 {summary_brief}
 
@@ -1100,11 +1286,7 @@ Character sketch:
         try:
             system_prompt = "You write concise narrations for web story slides. Always respond with plain text only, no markdown formatting."
             response = self._language_model.complete(system_prompt, narration_prompt.strip())
-            narration = textwrap.shorten(
-                self._clean_markdown(response.strip()),
-                width=target_limit,
-                placeholder="…"
-            )
+            narration = _truncate_text(self._clean_markdown(response.strip()), target_limit)
             return narration if narration else summary_brief[:target_limit]
         except Exception:
             return summary_brief[:target_limit] if summary_brief else "Unable to generate narration for this slide."
@@ -1114,18 +1296,9 @@ Character sketch:
         if not text:
             return ""
         
-        # Remove **bold**
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-        # Remove *italic*
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)
-        # Remove # headers
-        text = re.sub(r'#+\s*', '', text)
-        # Remove `code blocks`
-        text = re.sub(r'`([^`]+)`', r'\1', text)
-        # Remove [links](url)
-        text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+        text = _strip_markdown(text)
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _RE_WHITESPACE.sub(" ", text)
         text = text.strip()
         
         return text
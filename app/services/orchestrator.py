@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import json
 import re
-import random
+import string
 import hashlib
+import inspect
+import io
 import logging
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Callable, Optional, Sequence
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Iterator, Optional, Sequence
 from uuid import UUID, uuid4
 
 import httpx
+from pydantic import HttpUrl
 
 from app.domain.dto import (
     AnalysisReport,
@@ -20,9 +29,11 @@ from app.domain.dto import (
     IntakePayload,
     LanguageMetadata,
     Mode,
+    NarrativeResponse,
     RenderedPrompt,
     SlideDeck,
     StoryRecord,
+    StructuredJobRequest,
     VoiceAsset,
 )
 from app.domain.interfaces import (
@@ -31,6 +42,7 @@ from app.domain.interfaces import (
     ImageAssetPipeline,
     IngestionAggregator,
     LanguageDetectionService,
+    ModelClient,
     ModelRouter,
     PromptTemplateService,
     StoryRepository,
@@ -40,9 +52,130 @@ from app.domain.interfaces import (
 from app.services.prompt_templates import PromptSelectionController
 from app.services.html_renderer import HTMLTemplateRenderer
 from app.api.schemas import StoryCreateRequest
+from app.utils import LRUCache
 
+# Prefer orjson for parsing model output and hashing requests; fall back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+# boto3 is optional; without it S3 HTML uploads are skipped
+try:
+    from boto3.s3.transfer import TransferConfig
+    BOTO3_AVAILABLE = True
+except ImportError:
+    BOTO3_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Slug building: whitespace runs become hyphens, then any ASCII outside [a-z0-9-] is deleted
+_RE_SLUG_WHITESPACE = re.compile(r"\s+")
+_SLUG_DELETE_TABLE = dict.fromkeys(
+    code for code in range(128) if chr(code) not in string.ascii_lowercase + string.digits + "-"
+)
+
+# Prompt category used when the request does not name one
+DEFAULT_PROMPT_CATEGORY: dict[Mode, str] = {Mode.NEWS: "News", Mode.CURIOUS: "Art"}
+
+# Stored story category when the request does not name one ("News", "Curious")
+_MODE_LABELS: dict[Mode, str] = {mode: mode.value.title() for mode in Mode}
+
+# Public story URLs for News and Curious modes always live under this prefix
+STORY_URL_PREFIX = "https://suvichaar.org/stories/"
+# Story HTML above this size is uploaded in parallel multipart chunks; S3 rejects
+# parts under 5 MiB, so ordinary decks still go up as a single PUT
+HTML_UPLOAD_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+HTML_UPLOAD_EXTRA_ARGS = {"ContentType": "text/html; charset=utf-8"}
+if BOTO3_AVAILABLE:
+    # Single-PUT uploads run inline; a transfer thread pool only pays off for multipart
+    _HTML_SINGLE_PUT_TRANSFER_CONFIG = TransferConfig(
+        multipart_threshold=HTML_UPLOAD_MULTIPART_CHUNKSIZE,
+        use_threads=False,
+    )
+    _HTML_MULTIPART_TRANSFER_CONFIG = TransferConfig(
+        multipart_threshold=HTML_UPLOAD_MULTIPART_CHUNKSIZE,
+        multipart_chunksize=HTML_UPLOAD_MULTIPART_CHUNKSIZE,
+        max_concurrency=4,
+    )
+
+
+@lru_cache(maxsize=None)
+def _generate_accepts_slide_count(client_type: type) -> bool:
+    """Whether ``client_type.generate`` takes ``slide_count``; inspected once per client class."""
+    try:
+        parameters = inspect.signature(client_type.generate).parameters
+    except (AttributeError, TypeError, ValueError):
+        return False
+    return "slide_count" in parameters or any(
+        parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters.values()
+    )
+
+
+def _generate_news_narrative(
+    model_client: ModelClient,
+    rendered_prompt: RenderedPrompt,
+    doc_insights: DocInsights,
+    payload: IntakePayload,
+    request: StoryCreateRequest,
+) -> NarrativeResponse:
+    # NewsModelClient takes slide_count and category metadata
+    return model_client.generate(
+        rendered_prompt,
+        doc_insights,
+        slide_count=payload.slide_count,
+        category=request.category,
+        subcategory=None,  # Will be detected automatically
+        emotion=None,  # Will be detected automatically
+    )
+
+
+def _generate_curious_narrative(
+    model_client: ModelClient,
+    rendered_prompt: RenderedPrompt,
+    doc_insights: DocInsights,
+    payload: IntakePayload,
+    request: StoryCreateRequest,
+) -> NarrativeResponse:
+    # Pass slide_count for clients that support it
+    if _generate_accepts_slide_count(type(model_client)):
+        return model_client.generate(rendered_prompt, doc_insights, slide_count=payload.slide_count)
+    logger.debug("%s.generate doesn't support slide_count, using default", type(model_client).__name__)
+    return model_client.generate(rendered_prompt, doc_insights)
+
+
+# Mode-specific calling conventions for ModelClient.generate
+_NARRATIVE_GENERATORS: dict[Mode, Callable[..., NarrativeResponse]] = {
+    Mode.NEWS: _generate_news_narrative,
+    Mode.CURIOUS: _generate_curious_narrative,
+}
+
+
+def _datetime_uuid() -> str:
+    """Return the local-time ``ddmmyyhhminssms`` stamp used in story slugs (JS createSlugWithUUID)."""
+    now = datetime.now()
+    return f"{now:%d%m%y%H%M%S}{now.microsecond // 1000:03d}"
+
+
+@contextmanager
+def _stage(
+    failure: str, log_message: str, passthrough: tuple[type[Exception], ...] = ()
+) -> Iterator[None]:
+    """Log a failing pipeline stage and re-raise it as ``ValueError("<failure>: <error>")``.
+
+    Exceptions listed in ``passthrough`` propagate unchanged.
+    """
+    try:
+        yield
+    except passthrough:
+        raise
+    except Exception as e:
+        logger.error("%s: %s", log_message, e, exc_info=True)
+        raise ValueError(f"{failure}: {e}") from e
+
+
+@dataclass(slots=True)
 class StoryOrchestrator:
     """Coordinate all services to create and retrieve stories."""
 
@@ -61,215 +194,130 @@ class StoryOrchestrator:
     default_voice_provider: str = "azure_basic"
     story_base_url: Optional[str] = None
     save_to_database: bool = True  # Default to True - save stories to database
+    cache_identical_requests: bool = False  # Reuse generated content for repeated identical requests
+    request_cache_size: int = 128
+    request_cache_ttl: float = 300.0  # Seconds a generated story stays reusable
+    background_publish: bool = False  # Save and render HTML on a worker thread after returning the record
+    _base_prefix: Optional[str] = field(init=False, default=None, repr=False)
+    _request_cache: Optional[LRUCache] = field(init=False, default=None, repr=False)
+    _publish_queue: Optional[queue.Queue] = field(init=False, default=None, repr=False)
+    _save_executor: Optional[ThreadPoolExecutor] = field(init=False, default=None, repr=False)
+    _s3_client: Any = field(init=False, default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        # story_base_url is fixed for the orchestrator's lifetime; normalise it once
+        if self.story_base_url:
+            self._base_prefix = self.story_base_url.rstrip("/") + "/"
+        if self.cache_identical_requests and self.request_cache_size > 0:
+            self._request_cache = LRUCache(self.request_cache_size, ttl=self.request_cache_ttl)
+        if self.save_to_database and self.html_renderer:
+            # One long-lived worker overlaps each database write with the HTML render/upload
+            self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="story-save")
+        if self.background_publish:
+            self._publish_queue = queue.Queue()
+            threading.Thread(
+                target=self._drain_publish_queue, args=(self._publish_queue,), name="story-publisher", daemon=True
+            ).start()
+
+    def _drain_publish_queue(self, publish_queue: queue.Queue) -> None:
+        while True:
+            item = publish_queue.get()
+            try:
+                if item is None:
+                    return
+                self._publish(*item)
+            except Exception as e:
+                logger.warning("Background story publishing failed (non-critical): %s", e, exc_info=True)
+            finally:
+                publish_queue.task_done()
+
+    def flush(self) -> None:
+        """Block until every queued story has been saved and rendered."""
+        if self._publish_queue is not None:
+            self._publish_queue.join()
+
+    def close(self) -> None:
+        """Finish queued publishing work and stop the background workers."""
+        if self._publish_queue is not None:
+            self._publish_queue.put(None)
+            self._publish_queue.join()
+            self._publish_queue = None
+        if self._save_executor is not None:
+            self._save_executor.shutdown(wait=True)
+            self._save_executor = None
+
+    def _submit_publish(self, record: StoryRecord, image_source: Optional[str]) -> StoryRecord:
+        if self._publish_queue is None:
+            return self._publish(record, image_source)
+        self._publish_queue.put_nowait((record, image_source))
+        return record
+
+    def _request_cache_key(self, request: StoryCreateRequest) -> Optional[bytes]:
+        if self._request_cache is None:
+            return None
+        # force_refresh only controls the lookup, so a refreshed story replaces the cached one
+        data = request.model_dump(mode="json", exclude={"force_refresh"})
+        if ORJSON_AVAILABLE:
+            canonical = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        else:
+            canonical = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.blake2b(canonical, digest_size=16).digest()
 
     def create_story(self, request: StoryCreateRequest) -> StoryRecord:
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        try:
+        cache_key = self._request_cache_key(request)
+        if cache_key is not None and not request.force_refresh:
+            cached = self._request_cache.get(cache_key)
+            if cached is not None:
+                record, image_source = cached
+                story_id, created_at, canurl, canurl1 = self._stamp_story(record.mode, record.slide_deck)
+                logger.info("Reusing generated story for identical request as %s", story_id)
+                # model_copy skips validation, so coerce the URLs the way the StoryRecord fields would
+                restamped = record.model_copy(
+                    update={
+                        "id": story_id,
+                        "created_at": created_at,
+                        "canurl": HttpUrl(canurl) if canurl else None,
+                        "canurl1": HttpUrl(canurl1) if canurl1 else None,
+                    }
+                )
+                return self._submit_publish(restamped, image_source)
+
+        with _stage("Invalid request payload", "Failed to build intake payload"):
             payload = self._build_intake_payload(request)
             logger.debug("Built intake payload")
-        except Exception as e:
-            logger.error("Failed to build intake payload: %s", e, exc_info=True)
-            raise ValueError(f"Invalid request payload: {e}") from e
-        
-        try:
+
+        with _stage("Language detection failed", "Language detection failed"):
             language = self.language_service.detect(payload)
             logger.debug("Detected language: %s", language.language_code)
-        except Exception as e:
-            logger.error("Language detection failed: %s", e, exc_info=True)
-            raise ValueError(f"Language detection failed: {e}") from e
-        
-        try:
+
+        with _stage("Failed to aggregate job request", "Job request aggregation failed"):
             job_request = self.ingestion_aggregator.aggregate(payload, language)
             logger.debug("Aggregated job request")
-        except Exception as e:
-            logger.error("Job request aggregation failed: %s", e, exc_info=True)
-            raise ValueError(f"Failed to aggregate job request: {e}") from e
-        
-        try:
-            # CRITICAL LAYER 1: Create mode-specific document pipeline with mode-specific URL extractor
-            # This ensures News and Curious modes have isolated caches
-            from app.services.url_extractor import URLContentExtractor
-            from app.services.document_intelligence import DefaultDocumentIntelligencePipeline
-            
-            mode_str = payload.mode.value if hasattr(payload.mode, 'value') else str(payload.mode)
-            mode_specific_extractor = URLContentExtractor(mode=mode_str)
-            
-            # Create mode-specific doc pipeline for this request
-            mode_doc_pipeline = DefaultDocumentIntelligencePipeline(
-                ocr_adapters=self.doc_pipeline._ocr_adapters,
-                parser_adapters=self.doc_pipeline._parser_adapters,
-                url_extractor=mode_specific_extractor
-            )
-            
-            logger.warning(f"🔍 Using mode-specific URL extractor for mode: {mode_str}")
-            doc_insights = mode_doc_pipeline.run(job_request)
-            logger.debug("Document intelligence completed, chunks: %d", len(doc_insights.semantic_chunks))
-            
-            # CRITICAL: Validate that we got content from URLs if URLs were provided
-            if job_request.url_list and len(job_request.url_list) > 0:
-                if not doc_insights.semantic_chunks or len(doc_insights.semantic_chunks) == 0:
-                    error_msg = f"CRITICAL ERROR: No content extracted from {len(job_request.url_list)} URL(s). URLs: {[str(url) for url in job_request.url_list]}"
-                    logger.error(f"❌ {error_msg}")
-                    logger.error("❌ Story generation will fail or produce incorrect content!")
-                    raise ValueError(error_msg + " Please check the URLs and ensure article extraction is working.")
-                
-                # CRITICAL FINAL VALIDATION: Check if extracted content matches URL
-                # This is the LAST line of defense before story generation
-                first_chunk = doc_insights.semantic_chunks[0]
-                extracted_text = first_chunk.text.lower() if first_chunk.text else ""
-                extracted_title = first_chunk.metadata.get("title", "").lower() if first_chunk.metadata else ""
-                
-                # LANGUAGE-AGNOSTIC: Check if content is in Hindi/Unicode (same logic as url_extractor.py)
-                # Get original title (not lowercased) for Unicode detection
-                original_title = first_chunk.metadata.get("title", "") if first_chunk.metadata else ""
-                is_hindi_or_unicode = any(
-                    '\u0900' <= char <= '\u097F' or  # Devanagari (Hindi, Marathi, etc.)
-                    '\u0980' <= char <= '\u09FF' or  # Bengali
-                    '\u0A00' <= char <= '\u0A7F' or  # Gurmukhi (Punjabi)
-                    '\u0A80' <= char <= '\u0AFF' or  # Gujarati
-                    '\u0B00' <= char <= '\u0B7F' or  # Oriya
-                    '\u0B80' <= char <= '\u0BFF' or  # Tamil
-                    '\u0C00' <= char <= '\u0C7F' or  # Telugu
-                    '\u0C80' <= char <= '\u0CFF' or  # Kannada
-                    '\u0D00' <= char <= '\u0D7F'     # Malayalam
-                    for char in original_title
-                )
-                
-                if is_hindi_or_unicode:
-                    logger.warning("🌐 Final Validation: Detected Hindi/Unicode content - validation will be skipped")
-                
-                logger.warning(f"🔍 FINAL VALIDATION: Checking URL-content match")
-                logger.warning(f"🔍 Extracted title: {extracted_title[:100]}")
-                logger.warning(f"🔍 Extracted text preview: {extracted_text[:200]}")
-                
-                # Check each URL against extracted content
-                for url in job_request.url_list:
-                    url_str = str(url).lower()
-                    logger.warning(f"🔍 Checking URL: {url_str}")
-                    
-                    # GENERAL validation: Check if URL path keywords match extracted content
-                    # This is a general approach that works for ANY topic mismatch, not just specific cases
-                    from urllib.parse import urlparse
-                    parsed = urlparse(url_str if url_str.startswith('http') else f'https://{url_str}')
-                    path_parts = parsed.path.split('/')
-                    url_keywords = []
-                    skip_words = {'article', 'news', 'story', 'com', 'org', 'www', 'http', 'https', 'indianexpress',
-                                 'sports', 'cities', 'entertainment', 'technology', 'business', 'politics', 'world',
-                                 'local', 'health', 'science', 'education', 'lifestyle', 'opinion', 'editorial', 'html'}
-                    
-                    for part in path_parts:
-                        part = part.split('?')[0].split('#')[0].strip()
-                        if not part or part == '/':
-                            continue
-                        words = part.split('-')
-                        for word in words:
-                            if len(word) > 3 and word not in skip_words and not word.isdigit():
-                                url_keywords.append(word)
-                    
-                    # Check overlap: How many URL keywords appear in content?
-                    if url_keywords:
-                        top_url_keywords = sorted(set(url_keywords), key=len, reverse=True)[:10]
-                        content_text = f"{extracted_title} {extracted_text}"
-                        
-                        # Count UNIQUE keyword matches (more accurate)
-                        unique_matches = set()
-                        for kw in top_url_keywords:
-                            if kw in content_text:
-                                unique_matches.add(kw)
-                        actual_unique_matches = len(unique_matches)
-                        match_ratio = actual_unique_matches / len(top_url_keywords) if top_url_keywords else 0
-                        
-                        # ADAPTIVE VALIDATION: Skip for Hindi/Unicode content, strict for English
-                        if is_hindi_or_unicode:
-                            # For Hindi/Unicode content: Skip validation entirely
-                            # Hindi titles don't match English URL keywords
-                            logger.warning("🌐 Final Validation: Hindi/Unicode content detected - skipping URL-content match check")
-                            logger.warning("✅ Final Validation: Hindi/Unicode content accepted (validation skipped)")
-                            continue  # Skip validation for this URL, move to next or proceed
-                        
-                        # STRICT VALIDATION: Require at least 2-3 unique keywords to match (only for English)
-                        min_required_matches = max(2, min(3, len(top_url_keywords) // 3))
-                        
-                        logger.warning(f"🔍 Final Validation: URL keywords={top_url_keywords[:5]}")
-                        logger.warning(f"🔍 Final Validation: Unique matches={actual_unique_matches}/{len(top_url_keywords)}, Match ratio={match_ratio*100:.1f}%, Required={min_required_matches}")
-                        
-                        # CRITICAL: Reject if match ratio is very low OR not enough unique matches (only for English)
-                        if len(top_url_keywords) >= 3:
-                            if match_ratio < 0.1 or actual_unique_matches < min_required_matches:
-                                error_msg = f"CRITICAL MISMATCH DETECTED: URL keywords do not match extracted content. URL: {url_str}. Extracted title: {extracted_title[:100]}. URL keywords: {top_url_keywords}. Unique matches: {actual_unique_matches}/{len(top_url_keywords)} (required: {min_required_matches}). Match ratio: {match_ratio*100:.1f}% (expected >10%). This indicates wrong article was extracted. Story generation ABORTED."
-                                logger.error(f"❌ ===== FINAL VALIDATION FAILED =====")
-                                logger.error(f"❌ {error_msg}")
-                                raise ValueError(error_msg)
-                            else:
-                                logger.warning(f"✅ Final validation passed (%.1f%% match, %d unique matches, required %d)", match_ratio * 100, actual_unique_matches, min_required_matches)
-                        else:
-                            logger.warning(f"⚠️ Too few URL keywords ({len(top_url_keywords)}) for strict validation, accepting")
-                
-                # Log first chunk to verify content (using WARNING level so it shows in logs)
-                logger.warning(f"✅ Content extracted - First chunk preview: {first_chunk.text[:200] if first_chunk.text else 'Empty'}")
-                logger.warning(f"✅ Final validation passed - URL and content match")
-        except ValueError:
-            # Re-raise ValueError (our validation error)
-            raise
-        except Exception as e:
-            logger.error("Document intelligence pipeline failed: %s", e, exc_info=True)
-            raise ValueError(f"Document processing failed: {e}") from e
-        
-        try:
+
+        # ValueErrors here are our own extraction/validation errors and keep their message
+        with _stage("Document processing failed", "Document intelligence pipeline failed", passthrough=(ValueError,)):
+            doc_insights = self._run_document_pipeline(payload, job_request)
+            self._validate_extracted_content(job_request, doc_insights)
+
+        with _stage("Analysis failed", "Analysis failed"):
             analysis = self.analysis_facade.analyze(doc_insights)
             self._apply_analysis(doc_insights, analysis)
             logger.debug("Analysis completed")
-        except Exception as e:
-            logger.error("Analysis failed: %s", e, exc_info=True)
-            raise ValueError(f"Analysis failed: {e}") from e
 
-        try:
+        with _stage("Prompt rendering failed", "Prompt selection/rendering failed"):
             rendered_prompt = self.prompt_controller.select_prompt(
                 mode=payload.mode.value,
-                category=request.category or ("News" if payload.mode == Mode.NEWS else "Art"),
+                category=request.category or DEFAULT_PROMPT_CATEGORY[payload.mode],
                 language=language.language_code,
                 analysis=analysis,
                 keywords=payload.prompt_keywords,
             )
             logger.debug("Prompt selected and rendered")
-        except Exception as e:
-            logger.error("Prompt selection/rendering failed: %s", e, exc_info=True)
-            raise ValueError(f"Prompt rendering failed: {e}") from e
 
-        try:
+        with _stage("Narrative generation failed", "Narrative generation failed"):
             model_client = self.model_router.route(payload.mode)
-            # Pass slide_count and metadata to NewsModelClient if it's NEWS mode
-            if payload.mode == Mode.NEWS and hasattr(model_client, 'generate'):
-                # For NewsModelClient, pass slide_count and category metadata
-                narrative = model_client.generate(
-                    rendered_prompt,
-                    doc_insights,
-                    slide_count=payload.slide_count,
-                    category=request.category,
-                    subcategory=None,  # Will be detected automatically
-                    emotion=None,  # Will be detected automatically
-                )
-            elif payload.mode == Mode.CURIOUS and hasattr(model_client, 'generate'):
-                # For CuriousModelClient, pass slide_count if available
-                # Note: CuriousModelClient may not support slide_count yet, but we pass it for future compatibility
-                try:
-                    narrative = model_client.generate(
-                        rendered_prompt,
-                        doc_insights,
-                        slide_count=payload.slide_count,
-                    )
-                except TypeError:
-                    # Fallback if slide_count parameter not supported yet
-                    logger.debug("CuriousModelClient doesn't support slide_count yet, using default")
-                    narrative = model_client.generate(rendered_prompt, doc_insights)
-            else:
-                narrative = model_client.generate(rendered_prompt, doc_insights)
+            narrative = _NARRATIVE_GENERATORS[payload.mode](model_client, rendered_prompt, doc_insights, payload, request)
             logger.debug("Narrative generated, slides: %d", len(narrative.slide_deck.slides))
-        except Exception as e:
-            logger.error("Narrative generation failed: %s", e, exc_info=True)
-            raise ValueError(f"Narrative generation failed: {e}") from e
 
         # CRITICAL LAYER 3: Post-generation validation - check if generated story matches URL
         if job_request.url_list and len(job_request.url_list) > 0 and narrative.slide_deck.slides:
@@ -297,12 +345,18 @@ class StoryOrchestrator:
                 unique_keywords = list(dict.fromkeys(url_keywords[:5]))  # First 5 unique keywords
                 matches = sum(1 for kw in unique_keywords if kw in title_lower)
                 
-                logger.warning(f"🔍 Post-generation validation: URL keywords={unique_keywords}, Story title={story_title[:100]}, Matches={matches}")
+                logger.warning(
+                    "🔍 Post-generation validation: URL keywords=%s, Story title=%s, Matches=%d",
+                    unique_keywords, story_title[:100], matches,
+                )
                 
                 # If less than 2 keywords match and we have 3+ keywords, regenerate
                 if matches < 2 and len(unique_keywords) >= 3:
-                    logger.error(f"❌ Generated story doesn't match URL! Title: {story_title[:100]}, URL keywords: {unique_keywords}, Matches: {matches}")
-                    logger.error(f"❌ Regenerating with explicit URL context...")
+                    logger.error(
+                        "❌ Generated story doesn't match URL! Title: %s, URL keywords: %s, Matches: %d",
+                        story_title[:100], unique_keywords, matches,
+                    )
+                    logger.error("❌ Regenerating with explicit URL context...")
                     
                     # Add URL keywords to doc_insights metadata for forced regeneration
                     if doc_insights.metadata is None:
@@ -312,22 +366,17 @@ class StoryOrchestrator:
                     
                     # Regenerate narrative with URL context
                     try:
-                        if payload.mode == Mode.NEWS and hasattr(model_client, 'generate'):
-                            narrative = model_client.generate(
-                                rendered_prompt,
-                                doc_insights,
-                                slide_count=payload.slide_count,
-                                category=request.category,
-                                subcategory=None,
-                                emotion=None,
-                            )
-                        else:
-                            narrative = model_client.generate(rendered_prompt, doc_insights)
-                        logger.warning(f"✅ Regenerated story with URL context: {narrative.slide_deck.slides[0].text[:100] if narrative.slide_deck.slides else 'None'}")
+                        narrative = _NARRATIVE_GENERATORS[payload.mode](
+                            model_client, rendered_prompt, doc_insights, payload, request
+                        )
+                        logger.warning(
+                            "✅ Regenerated story with URL context: %s",
+                            narrative.slide_deck.slides[0].text[:100] if narrative.slide_deck.slides else "None",
+                        )
                     except Exception as regen_error:
-                        logger.error(f"❌ Regeneration failed: {regen_error}, continuing with original narrative")
+                        logger.error("❌ Regeneration failed: %s, continuing with original narrative", regen_error)
                 else:
-                    logger.warning(f"✅ Post-generation validation passed: {matches} keywords matched")
+                    logger.warning("✅ Post-generation validation passed: %d keywords matched", matches)
 
         # Extract article images from doc_insights metadata
         article_images = None
@@ -339,84 +388,50 @@ class StoryOrchestrator:
         article_content = None
         if doc_insights.semantic_chunks:
             article_content = " ".join([chunk.text for chunk in doc_insights.semantic_chunks if chunk.text])
-            logger.debug(f"Extracted article content for image generation: {len(article_content)} characters")
+            logger.debug("Extracted article content for image generation: %d characters", len(article_content))
 
         # For Curious mode, extract alt texts from narrative and pass to image pipeline
         # For News mode, pass article content for relevant image generation
-        updated_payload = payload  # Default to original payload
+        image_metadata: dict = {}
         if payload.mode == Mode.CURIOUS and hasattr(narrative, "raw_output"):
             try:
-                import json
-                narrative_json = json.loads(narrative.raw_output) if isinstance(narrative.raw_output, str) else narrative.raw_output
+                narrative_json = getattr(narrative, "parsed_output", None)
+                if narrative_json is None and isinstance(narrative.raw_output, (str, bytes)):
+                    narrative_json = orjson.loads(narrative.raw_output) if ORJSON_AVAILABLE else json.loads(narrative.raw_output)
                 if isinstance(narrative_json, dict):
-                    # Properly update Pydantic model metadata (create new instance)
-                    updated_metadata = dict(payload.metadata) if payload.metadata else {}
-                    updated_metadata["narrative_json"] = narrative_json
-                    # Create new payload with updated metadata
-                    updated_payload = payload.model_copy(update={"metadata": updated_metadata})
-                    logger.debug("Extracted alt texts from Curious narrative for image generation")
-                    logger.debug(f"Narrative JSON has keys: {list(narrative_json.keys())[:15]}")
-                    # Log alt text availability
-                    alt_keys = [k for k in narrative_json.keys() if "alt1" in k]
-                    logger.debug(f"Found alt text keys: {alt_keys}")
-                    logger.info(f"Updated payload metadata with narrative_json for {len(alt_keys)} alt texts")
+                    image_metadata["narrative_json"] = narrative_json
+                    # Key listings are diagnostics only; skip the scan unless DEBUG is on
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Extracted alt texts from Curious narrative for image generation")
+                        logger.debug("Narrative JSON has keys: %s", list(narrative_json)[:15])
+                        logger.debug("Found alt text keys: %s", [k for k in narrative_json if "alt1" in k])
+                    logger.info("Updated payload metadata with narrative_json")
             except Exception as e:
                 logger.warning("Failed to extract alt texts from narrative: %s", e, exc_info=True)
-        
+
         # For News mode, add article content to metadata for image generation
         if payload.mode == Mode.NEWS and article_content:
-            try:
-                updated_metadata = dict(updated_payload.metadata) if updated_payload.metadata else {}
-                updated_metadata["article_content"] = article_content
-                updated_payload = updated_payload.model_copy(update={"metadata": updated_metadata})
-                logger.info(f"Added article content to payload metadata for News mode image generation ({len(article_content)} chars)")
-            except Exception as e:
-                logger.warning("Failed to add article content to payload metadata: %s", e, exc_info=True)
-        
-        try:
-            print(f"\n{'='*60}")
-            print(f"🖼️ ORCHESTRATOR: Starting image pipeline")
-            print(f"Mode: {payload.mode.value}, Image Source: {payload.image_source}, Slide Count: {payload.slide_count}")
-            print(f"{'='*60}\n")
-            logger.warning("🖼️ Starting image pipeline: mode=%s image_source=%s slide_count=%d", 
-                          payload.mode.value, payload.image_source, payload.slide_count)
-            image_assets = self.image_pipeline.process(narrative.slide_deck, updated_payload, article_images=article_images)
-            print(f"✅ ORCHESTRATOR: Image assets processed: {len(image_assets)}\n")
-            logger.warning("🖼️ Image assets processed: %d", len(image_assets))
-        except Exception as e:
-            print(f"\n❌ ORCHESTRATOR: Image pipeline failed: {e}\n")
-            import traceback
-            traceback.print_exc()
-            logger.warning("❌ Image pipeline failed (non-critical): %s", e, exc_info=True)
-            image_assets = []  # Continue without images
-        
-        try:
-            voice_provider = payload.voice_engine or self.default_voice_provider
-            logger.warning("Voice synthesis requested with provider=%s", voice_provider)
-            voice_assets = (
-                self.voice_service.synthesize(narrative.slide_deck, language, voice_provider)
-                if voice_provider
-                else []
-            )
-            logger.warning("Voice assets synthesized count=%d", len(voice_assets))
-        except Exception as e:
-            logger.warning("Voice synthesis failed (non-critical): %s", e, exc_info=True)
-            voice_assets = []  # Continue without voice
+            image_metadata["article_content"] = article_content
+            logger.info("Added article content to payload metadata for News mode image generation (%d chars)", len(article_content))
 
-        story_id = self.id_factory()
-        created_at = datetime.utcnow()
-        
-        # Get story title for URL generation (News and Curious modes use title-based URLs)
-        story_title = None
-        if payload.mode in [Mode.NEWS, Mode.CURIOUS] and narrative.slide_deck.slides:
-            story_title = narrative.slide_deck.slides[0].text or None
-        
-        canurl, canurl1 = self._build_canurls(story_id, story_title=story_title, mode=payload.mode)
+        # model_copy is shallow, so only the metadata dict is new; the rest of the payload is shared
+        updated_payload = payload
+        if image_metadata:
+            updated_payload = payload.model_copy(update={"metadata": {**(payload.metadata or {}), **image_metadata}})
+
+        # Image generation and voice synthesis only read the slide deck, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            image_future = executor.submit(self._process_images, narrative.slide_deck, updated_payload, article_images)
+            voice_future = executor.submit(self._synthesize_voice, narrative.slide_deck, language, payload)
+            image_assets = image_future.result()
+            voice_assets = voice_future.result()
+
+        story_id, created_at, canurl, canurl1 = self._stamp_story(payload.mode, narrative.slide_deck)
 
         record = StoryRecord(
             id=story_id,
             mode=payload.mode,
-            category=request.category or narrative.mode.value.title(),
+            category=request.category or _MODE_LABELS[narrative.mode],
             input_language=language.language_code,
             slide_count=payload.slide_count,
             template_key=payload.template_key,
@@ -431,83 +446,127 @@ class StoryOrchestrator:
             created_at=created_at,
         )
 
-        # Save to database only if enabled
-        if self.save_to_database:
-            try:
-                self.repository.save(record)
-                logger.debug("Story saved to database successfully")
-            except Exception as e:
-                # Database save is non-critical - story generation should continue even if save fails
-                logger.warning("Failed to save story to database (non-critical): %s", e)
-                logger.debug("Database error details:", exc_info=True)
-                # Continue without database save - story generation is still successful
-
-        # Generate and save HTML if renderer is available
-        html_file_path = None
-        if self.html_renderer:
-            try:
-                html_content = self.html_renderer.render(
-                    record=record,
-                    template_key=payload.template_key,
-                    template_source="file",
-                    image_source=payload.image_source,
-                )
-                # Save HTML to file
-                html_file_path = self.html_renderer.save_html_to_file(
-                    html_content=html_content,
-                    story_id=story_id,
-                )
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.info("HTML saved to: %s", html_file_path)
-                
-                # For News and Curious modes, upload HTML to S3 bucket "suvichaarstories" with slug-based filename
-                if payload.mode in [Mode.NEWS, Mode.CURIOUS] and record.canurl1:
-                    try:
-                        # Extract slug filename from canurl1: https://suvichaar.org/stories/slug_nano.html -> slug_nano.html
-                        canurl1_str = str(record.canurl1)
-                        if "suvichaar.org/stories/" in canurl1_str:
-                            slug_filename = canurl1_str.split("suvichaar.org/stories/")[-1]
-                            # slug_filename should be like "tragic-accident-near-navale-bridge-leaves-several-dead-and-injured-in-pune_KKd2kdX729_G.html"
-                            
-                            # Get AWS settings
-                            from app.config import get_settings
-                            settings = get_settings()
-                            
-                            # Upload to S3 bucket "suvichaarstories" with slug-based filename
-                            import boto3
-                            s3_client = boto3.client(
-                                "s3",
-                                aws_access_key_id=settings.aws.access_key,
-                                aws_secret_access_key=settings.aws.secret_key,
-                                region_name=settings.aws.region or "us-east-1",
-                            )
-                            
-                            s3_client.put_object(
-                                Bucket="suvichaarstories",
-                                Key=slug_filename,  # Use slug-based filename (e.g., "slug_nano.html")
-                                Body=html_content.encode("utf-8"),
-                                ContentType="text/html; charset=utf-8",
-                            )
-                            
-                            logger.info("Uploaded HTML to S3: s3://suvichaarstories/%s", slug_filename)
-                    except ImportError:
-                        logger.warning("boto3 not installed, S3 HTML upload skipped")
-                    except Exception as e:
-                        logger.warning("Failed to upload HTML to S3 (non-critical): %s", e)
-                        logger.debug("S3 upload error details:", exc_info=True)
-                        # Continue without S3 upload - story creation should succeed
-                        
-            except Exception as e:
-                # Log error but don't fail story creation - HTML saving is optional
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning("HTML rendering/saving failed (non-critical): %s", e)
-                logger.debug("HTML error details:", exc_info=True)
-                # Continue without HTML file - story creation should succeed
+        if cache_key is not None:
+            self._request_cache.put(cache_key, (record, payload.image_source))
 
+        return self._submit_publish(record, payload.image_source)
+
+    def _stamp_story(self, mode: Mode, slide_deck: SlideDeck) -> tuple[UUID, datetime, Optional[str], Optional[str]]:
+        """Allocate the id, timestamp and canonical URLs for a newly created story."""
+        story_id = self.id_factory()
+        created_at = datetime.now(timezone.utc)
+        
+        # Get story title for URL generation (News and Curious modes use title-based URLs)
+        story_title = None
+        if mode in [Mode.NEWS, Mode.CURIOUS] and slide_deck.slides:
+            story_title = slide_deck.slides[0].text or None
+        
+        canurl, canurl1 = self._build_canurls(story_id, story_title=story_title, mode=mode)
+        return story_id, created_at, canurl, canurl1
+
+    def _publish(self, record: StoryRecord, image_source: Optional[str]) -> StoryRecord:
+        """Persist the record and render/upload its HTML; both steps are non-critical."""
+        # Save to database only if enabled; generate and save HTML if renderer is available
+        if self._save_executor is not None:
+            # The database write and the HTML render/upload are independent, so overlap them
+            save_future = self._save_executor.submit(self._save_record, record)
+            self._publish_html(record, image_source)
+            save_future.result()
+        elif self.save_to_database and self.html_renderer:
+            # Closed orchestrator: no save worker left, so run both steps inline
+            self._save_record(record)
+            self._publish_html(record, image_source)
+        elif self.save_to_database:
+            self._save_record(record)
+        elif self.html_renderer:
+            self._publish_html(record, image_source)
         return record
 
+    def _get_s3_client(self):
+        """Lazy-load the boto3 S3 client used for story HTML uploads.
+
+        boto3 clients are thread-safe, so one client (and its connection pool) is
+        shared by every upload. Raises ImportError when boto3 is not installed.
+        """
+        if self._s3_client is None:
+            import boto3
+            from app.config import get_settings
+
+            settings = get_settings()
+            self._s3_client = boto3.client(
+                "s3",
+                aws_access_key_id=settings.aws.access_key,
+                aws_secret_access_key=settings.aws.secret_key,
+                region_name=settings.aws.region or "us-east-1",
+            )
+        return self._s3_client
+
+    def _save_record(self, record: StoryRecord) -> None:
+        try:
+            self.repository.save(record)
+            logger.debug("Story saved to database successfully")
+        except Exception as e:
+            # Database save is non-critical - story generation should continue even if save fails
+            logger.warning("Failed to save story to database (non-critical): %s", e)
+            logger.debug("Database error details:", exc_info=True)
+            # Continue without database save - story generation is still successful
+
+    def _publish_html(self, record: StoryRecord, image_source: Optional[str]) -> None:
+        story_id = record.id
+        try:
+            html_content = self.html_renderer.render(
+                record=record,
+                template_key=record.template_key,
+                template_source="file",
+                image_source=image_source,
+            )
+            # Encode once; the same bytes go to the local file and the S3 upload
+            html_bytes = html_content.encode("utf-8")
+            # Save HTML to file
+            html_file_path = self.html_renderer.save_html_to_file(
+                html_content=html_bytes,
+                story_id=story_id,
+            )
+            logger.info("HTML saved to: %s", html_file_path)
+            
+            # For News and Curious modes, upload HTML to S3 bucket "suvichaarstories" with slug-based filename
+            if record.mode in [Mode.NEWS, Mode.CURIOUS] and record.canurl1:
+                try:
+                    # Extract slug filename from canurl1: https://suvichaar.org/stories/slug_nano.html -> slug_nano.html
+                    canurl1_str = str(record.canurl1)
+                    if "suvichaar.org/stories/" in canurl1_str:
+                        slug_filename = canurl1_str.split("suvichaar.org/stories/")[-1]
+                        # slug_filename should be like "tragic-accident-near-navale-bridge-leaves-several-dead-and-injured-in-pune_KKd2kdX729_G.html"
+                        
+                        # Upload to S3 bucket "suvichaarstories" with slug-based filename;
+                        # oversized decks go up as parallel multipart chunks
+                        s3_client = self._get_s3_client()
+                        s3_client.upload_fileobj(
+                            io.BytesIO(html_bytes),
+                            "suvichaarstories",
+                            slug_filename,  # Use slug-based filename (e.g., "slug_nano.html")
+                            ExtraArgs=HTML_UPLOAD_EXTRA_ARGS,
+                            Config=(
+                                _HTML_MULTIPART_TRANSFER_CONFIG
+                                if len(html_bytes) >= HTML_UPLOAD_MULTIPART_CHUNKSIZE
+                                else _HTML_SINGLE_PUT_TRANSFER_CONFIG
+                            ),
+                        )
+                        
+                        logger.info("Uploaded HTML to S3: s3://suvichaarstories/%s", slug_filename)
+                except ImportError:
+                    logger.warning("boto3 not installed, S3 HTML upload skipped")
+                except Exception as e:
+                    logger.warning("Failed to upload HTML to S3 (non-critical): %s", e)
+                    logger.debug("S3 upload error details:", exc_info=True)
+                    # Continue without S3 upload - story creation should succeed
+                    
+        except Exception as e:
+            # Log error but don't fail story creation - HTML saving is optional
+            logger.warning("HTML rendering/saving failed (non-critical): %s", e)
+            logger.debug("HTML error details:", exc_info=True)
+            # Continue without HTML file - story creation should succeed
+
     def get_story(self, story_id: str) -> StoryRecord:
         return self.repository.get(story_id)
 
@@ -516,8 +575,6 @@ class StoryOrchestrator:
         Get story by slug from URL.
         Handles both full URLs and just the slug part.
         """
-        import logging
-        logger = logging.getLogger(__name__)
         
         # Extract slug from URL if full URL is provided
         # e.g., "https://suvichaar.org/stories/slug_nano" -> "slug_nano"
@@ -530,23 +587,179 @@ class StoryOrchestrator:
                 slug = slug[:-5]
         
         # Try to find by canurl (without .html)
-        canurl = f"https://suvichaar.org/stories/{slug}"
-        canurl1 = f"https://suvichaar.org/stories/{slug}.html"
+        canurl = f"{STORY_URL_PREFIX}{slug}"
+        canurl1 = f"{canurl}.html"
         
+        # One lookup tries canurl, then canurl1, then the bare slug
         try:
-            # First try exact match with canurl
-            return self.repository.get_by_canurl(canurl)
+            return self.repository.get_by_canurls((canurl, canurl1, slug))
         except KeyError:
-            try:
-                # Then try with canurl1
-                return self.repository.get_by_canurl(canurl1)
-            except KeyError:
-                # Finally try with just the slug part
-                try:
-                    return self.repository.get_by_canurl(slug)
-                except KeyError:
-                    logger.error("Story not found for slug: %s (tried: %s, %s, %s)", slug, canurl, canurl1, slug)
-                    raise KeyError(f"Story with slug {slug} not found.")
+            logger.error("Story not found for slug: %s (tried: %s, %s, %s)", slug, canurl, canurl1, slug)
+            raise KeyError(f"Story with slug {slug} not found.")
+
+    def _run_document_pipeline(self, payload: IntakePayload, job_request: StructuredJobRequest) -> DocInsights:
+        """Run document intelligence with an extractor scoped to the request mode."""
+        # CRITICAL LAYER 1: Create mode-specific document pipeline with mode-specific URL extractor
+        # This ensures News and Curious modes have isolated caches
+        from app.services.url_extractor import URLContentExtractor
+        from app.services.document_intelligence import DefaultDocumentIntelligencePipeline
+        
+        mode_str = payload.mode.value if hasattr(payload.mode, 'value') else str(payload.mode)
+        mode_specific_extractor = URLContentExtractor(mode=mode_str)
+        
+        # Create mode-specific doc pipeline for this request
+        mode_doc_pipeline = DefaultDocumentIntelligencePipeline(
+            ocr_adapters=self.doc_pipeline._ocr_adapters,
+            parser_adapters=self.doc_pipeline._parser_adapters,
+            url_extractor=mode_specific_extractor
+        )
+        
+        logger.warning("🔍 Using mode-specific URL extractor for mode: %s", mode_str)
+        doc_insights = mode_doc_pipeline.run(job_request)
+        logger.debug("Document intelligence completed, chunks: %d", len(doc_insights.semantic_chunks))
+        
+        return doc_insights
+
+    def _validate_extracted_content(self, job_request: StructuredJobRequest, doc_insights: DocInsights) -> None:
+        """Reject extractions whose content does not match the requested URLs."""
+        # CRITICAL: Validate that we got content from URLs if URLs were provided
+        if job_request.url_list and len(job_request.url_list) > 0:
+            if not doc_insights.semantic_chunks or len(doc_insights.semantic_chunks) == 0:
+                error_msg = f"CRITICAL ERROR: No content extracted from {len(job_request.url_list)} URL(s). URLs: {[str(url) for url in job_request.url_list]}"
+                logger.error("❌ %s", error_msg)
+                logger.error("❌ Story generation will fail or produce incorrect content!")
+                raise ValueError(error_msg + " Please check the URLs and ensure article extraction is working.")
+        
+            # CRITICAL FINAL VALIDATION: Check if extracted content matches URL
+            # This is the LAST line of defense before story generation
+            first_chunk = doc_insights.semantic_chunks[0]
+            extracted_text = first_chunk.text.lower() if first_chunk.text else ""
+            extracted_title = first_chunk.metadata.get("title", "").lower() if first_chunk.metadata else ""
+        
+            # LANGUAGE-AGNOSTIC: Check if content is in Hindi/Unicode (same logic as url_extractor.py)
+            # Get original title (not lowercased) for Unicode detection
+            original_title = first_chunk.metadata.get("title", "") if first_chunk.metadata else ""
+            is_hindi_or_unicode = any(
+                '\u0900' <= char <= '\u097F' or  # Devanagari (Hindi, Marathi, etc.)
+                '\u0980' <= char <= '\u09FF' or  # Bengali
+                '\u0A00' <= char <= '\u0A7F' or  # Gurmukhi (Punjabi)
+                '\u0A80' <= char <= '\u0AFF' or  # Gujarati
+                '\u0B00' <= char <= '\u0B7F' or  # Oriya
+                '\u0B80' <= char <= '\u0BFF' or  # Tamil
+                '\u0C00' <= char <= '\u0C7F' or  # Telugu
+                '\u0C80' <= char <= '\u0CFF' or  # Kannada
+                '\u0D00' <= char <= '\u0D7F'     # Malayalam
+                for char in original_title
+            )
+        
+            if is_hindi_or_unicode:
+                logger.warning("🌐 Final Validation: Detected Hindi/Unicode content - validation will be skipped")
+        
+            logger.warning("🔍 FINAL VALIDATION: Checking URL-content match")
+            logger.warning("🔍 Extracted title: %s", extracted_title[:100])
+            logger.warning("🔍 Extracted text preview: %s", extracted_text[:200])
+        
+            # Check each URL against extracted content
+            for url in job_request.url_list:
+                url_str = str(url).lower()
+                logger.warning("🔍 Checking URL: %s", url_str)
+            
+                # GENERAL validation: Check if URL path keywords match extracted content
+                # This is a general approach that works for ANY topic mismatch, not just specific cases
+                from urllib.parse import urlparse
+                parsed = urlparse(url_str if url_str.startswith('http') else f'https://{url_str}')
+                path_parts = parsed.path.split('/')
+                url_keywords = []
+                skip_words = {'article', 'news', 'story', 'com', 'org', 'www', 'http', 'https', 'indianexpress',
+                             'sports', 'cities', 'entertainment', 'technology', 'business', 'politics', 'world',
+                             'local', 'health', 'science', 'education', 'lifestyle', 'opinion', 'editorial', 'html'}
+            
+                for part in path_parts:
+                    part = part.split('?')[0].split('#')[0].strip()
+                    if not part or part == '/':
+                        continue
+                    words = part.split('-')
+                    for word in words:
+                        if len(word) > 3 and word not in skip_words and not word.isdigit():
+                            url_keywords.append(word)
+            
+                # Check overlap: How many URL keywords appear in content?
+                if url_keywords:
+                    top_url_keywords = sorted(set(url_keywords), key=len, reverse=True)[:10]
+                    content_text = f"{extracted_title} {extracted_text}"
+                
+                    # Count UNIQUE keyword matches (more accurate)
+                    unique_matches = set()
+                    for kw in top_url_keywords:
+                        if kw in content_text:
+                            unique_matches.add(kw)
+                    actual_unique_matches = len(unique_matches)
+                    match_ratio = actual_unique_matches / len(top_url_keywords) if top_url_keywords else 0
+                
+                    # ADAPTIVE VALIDATION: Skip for Hindi/Unicode content, strict for English
+                    if is_hindi_or_unicode:
+                        # For Hindi/Unicode content: Skip validation entirely
+                        # Hindi titles don't match English URL keywords
+                        logger.warning("🌐 Final Validation: Hindi/Unicode content detected - skipping URL-content match check")
+                        logger.warning("✅ Final Validation: Hindi/Unicode content accepted (validation skipped)")
+                        continue  # Skip validation for this URL, move to next or proceed
+                
+                    # STRICT VALIDATION: Require at least 2-3 unique keywords to match (only for English)
+                    min_required_matches = max(2, min(3, len(top_url_keywords) // 3))
+                
+                    logger.warning("🔍 Final Validation: URL keywords=%s", top_url_keywords[:5])
+                    logger.warning(
+                        "🔍 Final Validation: Unique matches=%d/%d, Match ratio=%.1f%%, Required=%d",
+                        actual_unique_matches, len(top_url_keywords), match_ratio * 100, min_required_matches,
+                    )
+                
+                    # CRITICAL: Reject if match ratio is very low OR not enough unique matches (only for English)
+                    if len(top_url_keywords) >= 3:
+                        if match_ratio < 0.1 or actual_unique_matches < min_required_matches:
+                            error_msg = f"CRITICAL MISMATCH DETECTED: URL keywords do not match extracted content. URL: {url_str}. Extracted title: {extracted_title[:100]}. URL keywords: {top_url_keywords}. Unique matches: {actual_unique_matches}/{len(top_url_keywords)} (required: {min_required_matches}). Match ratio: {match_ratio*100:.1f}% (expected >10%). This indicates wrong article was extracted. Story generation ABORTED."
+                            logger.error("❌ ===== FINAL VALIDATION FAILED =====")
+                            logger.error("❌ %s", error_msg)
+                            raise ValueError(error_msg)
+                        else:
+                            logger.warning("✅ Final validation passed (%.1f%% match, %d unique matches, required %d)", match_ratio * 100, actual_unique_matches, min_required_matches)
+                    else:
+                        logger.warning("⚠️ Too few URL keywords (%d) for strict validation, accepting", len(top_url_keywords))
+        
+            # Log first chunk to verify content (using WARNING level so it shows in logs)
+            logger.warning("✅ Content extracted - First chunk preview: %s", first_chunk.text[:200] if first_chunk.text else "Empty")
+            logger.warning("✅ Final validation passed - URL and content match")
+
+    def _process_images(
+        self, deck: SlideDeck, payload: IntakePayload, article_images: Optional[list] = None
+    ) -> list[ImageAsset]:
+        """Run the image pipeline; failures are non-critical and yield no images."""
+        try:
+            logger.warning("🖼️ Starting image pipeline: mode=%s image_source=%s slide_count=%d", 
+                          payload.mode.value, payload.image_source, payload.slide_count)
+            image_assets = self.image_pipeline.process(deck, payload, article_images=article_images)
+            logger.warning("🖼️ Image assets processed: %d", len(image_assets))
+            return image_assets
+        except Exception as e:
+            logger.warning("❌ Image pipeline failed (non-critical): %s", e, exc_info=True)
+            return []  # Continue without images
+
+    def _synthesize_voice(
+        self, deck: SlideDeck, language: LanguageMetadata, payload: IntakePayload
+    ) -> list[VoiceAsset]:
+        """Run voice synthesis; failures are non-critical and yield no audio."""
+        try:
+            voice_provider = payload.voice_engine or self.default_voice_provider
+            logger.warning("Voice synthesis requested with provider=%s", voice_provider)
+            voice_assets = (
+                self.voice_service.synthesize(deck, language, voice_provider)
+                if voice_provider
+                else []
+            )
+            logger.warning("Voice assets synthesized count=%d", len(voice_assets))
+            return voice_assets
+        except Exception as e:
+            logger.warning("Voice synthesis failed (non-critical): %s", e, exc_info=True)
+            return []  # Continue without voice
 
     def _build_intake_payload(self, request: StoryCreateRequest) -> IntakePayload:
         return self.user_input_service.build_payload(
@@ -594,7 +807,6 @@ class StoryOrchestrator:
             - canurl: Primary URL (without .html) - https://suvichaar.org/stories/{slug}_{uuid}
             - canurl1: Secondary URL (with .html) - https://suvichaar.org/stories/{slug}_{uuid}.html
         """
-        logger = logging.getLogger(__name__)
         
         # For News and Curious modes, ALWAYS use title-based slug + date/time UUID format
         if mode in [Mode.NEWS, Mode.CURIOUS]:
@@ -614,67 +826,38 @@ class StoryOrchestrator:
                     slug = f"story-{str(story_id).replace('-', '')[:16]}"
                 
                 # Step 2: Generate UUID based on current date and time
-                # Format: ddmmyyhhminssms (14 digits)
-                # Matching JavaScript: dd + mm + yy + hh + min + ss + ms
-                now = datetime.now()
-                dd = f"{now.day:02d}"           # Day (2 digits, zero-padded)
-                mm = f"{now.month:02d}"          # Month (2 digits, zero-padded)
-                yy = f"{now.year % 100:02d}"     # Year (last 2 digits, zero-padded)
-                hh = f"{now.hour:02d}"           # Hour (2 digits, zero-padded)
-                min_str = f"{now.minute:02d}"    # Minute (2 digits, zero-padded)
-                ss = f"{now.second:02d}"         # Second (2 digits, zero-padded)
-                ms = f"{now.microsecond // 1000:03d}"  # Milliseconds (3 digits, zero-padded)
-                
-                uuid_str = f"{dd}{mm}{yy}{hh}{min_str}{ss}{ms}"
-                
                 # Step 3: Concatenate slug and UUID (no "_G" suffix)
-                slug_uuid = f"{slug}_{uuid_str}"
-                
-                # ALWAYS use hardcoded base URL: https://suvichaar.org/stories
-                base_url = "https://suvichaar.org/stories"
+                slug_uuid = f"{slug}_{_datetime_uuid()}"
                 
                 # canurl: without .html extension (for display)
-                canurl = f"{base_url}/{slug_uuid}"
+                canurl = f"{STORY_URL_PREFIX}{slug_uuid}"
                 
                 # canurl1: with .html extension (for S3 storage)
-                canurl1 = f"{base_url}/{slug_uuid}.html"
+                canurl1 = f"{canurl}.html"
                 
-                logger.info(f"✅ Generated URLs: canurl={canurl}, canurl1={canurl1}")
+                logger.info("✅ Generated URLs: canurl=%s, canurl1=%s", canurl, canurl1)
                 return canurl, canurl1
                 
             except Exception as e:
                 logger.error("Failed to generate title-based URLs: %s", e, exc_info=True)
                 # Even on exception, try to generate URLs with minimal info
                 try:
-                    now = datetime.now()
-                    dd = f"{now.day:02d}"
-                    mm = f"{now.month:02d}"
-                    yy = f"{now.year % 100:02d}"
-                    hh = f"{now.hour:02d}"
-                    min_str = f"{now.minute:02d}"
-                    ss = f"{now.second:02d}"
-                    ms = f"{now.microsecond // 1000:03d}"
-                    uuid_str = f"{dd}{mm}{yy}{hh}{min_str}{ss}{ms}"
-                    
                     slug = f"story-{str(story_id).replace('-', '')[:16]}"
-                    slug_uuid = f"{slug}_{uuid_str}"
-                    base_url = "https://suvichaar.org/stories"
+                    slug_uuid = f"{slug}_{_datetime_uuid()}"
                     
-                    canurl = f"{base_url}/{slug_uuid}"
-                    canurl1 = f"{base_url}/{slug_uuid}.html"
+                    canurl = f"{STORY_URL_PREFIX}{slug_uuid}"
+                    canurl1 = f"{canurl}.html"
                     
-                    logger.warning(f"⚠️ Generated URLs with fallback: canurl={canurl}, canurl1={canurl1}")
+                    logger.warning("⚠️ Generated URLs with fallback: canurl=%s, canurl1=%s", canurl, canurl1)
                     return canurl, canurl1
                 except Exception as e2:
                     logger.error("Complete failure in URL generation: %s", e2, exc_info=True)
                     return None, None
         
         # Fallback for other modes: use story_id format (if story_base_url is available)
-        if self.story_base_url:
-            base = self.story_base_url.rstrip("/")
-            primary = f"{base}/{story_id}"
-            secondary = f"{primary}?variant=alt"
-            return primary, secondary
+        if self._base_prefix:
+            primary = f"{self._base_prefix}{story_id}"
+            return primary, f"{primary}?variant=alt"
         
         return None, None
     
@@ -689,7 +872,6 @@ class StoryOrchestrator:
         - Remove non-alphanumeric characters (except hyphens)
         - Remove leading/trailing hyphens
         """
-        logger = logging.getLogger(__name__)
         
         try:
             if not title or not isinstance(title, str):
@@ -699,17 +881,19 @@ class StoryOrchestrator:
             original_title = title  # Keep original for fallback
             
             # Step 1: Check if title contains non-ASCII characters (any non-English language)
-            # Count ASCII vs non-ASCII characters
-            ascii_chars = sum(1 for c in title if ord(c) < 128)
-            non_ascii_chars = len(title) - ascii_chars
-            
-            # If more than 30% non-ASCII, consider it non-English and transliterate
-            total_chars = len(title.replace(' ', ''))  # Exclude spaces for calculation
-            if total_chars > 0:
-                non_ascii_ratio = non_ascii_chars / total_chars
-                needs_transliteration = non_ascii_ratio > 0.3  # 30% threshold
+            if title.isascii():
+                needs_transliteration = False
             else:
-                needs_transliteration = non_ascii_chars > 0
+                # Count non-ASCII characters; encoding drops them, leaving one byte per ASCII char
+                non_ascii_chars = len(title) - len(title.encode('ascii', 'ignore'))
+                
+                # If more than 30% non-ASCII, consider it non-English and transliterate
+                total_chars = len(title) - title.count(' ')  # Exclude spaces for calculation
+                if total_chars > 0:
+                    non_ascii_ratio = non_ascii_chars / total_chars
+                    needs_transliteration = non_ascii_ratio > 0.3  # 30% threshold
+                else:
+                    needs_transliteration = non_ascii_chars > 0
             
             # Step 2: If non-English, try to transliterate to English
             if needs_transliteration:
@@ -727,16 +911,15 @@ class StoryOrchestrator:
                     # Continue with original title
             
             # Step 3: Convert to lowercase
-            slug = title.lower()
-            
             # Step 4: Replace spaces with hyphens
-            slug = re.sub(r'\s+', '-', slug)
+            slug = _RE_SLUG_WHITESPACE.sub('-', title.lower())
             
-            # Step 5: Remove non-alphanumeric characters (except hyphens)
-            slug = re.sub(r'[^a-z0-9-]', '', slug)
+            # Step 5: Remove non-alphanumeric characters (except hyphens):
+            # non-ASCII is dropped by the encode, the rest by one translate pass
+            slug = slug.encode('ascii', 'ignore').decode('ascii').translate(_SLUG_DELETE_TABLE)
             
             # Step 6: Remove leading or trailing hyphens
-            slug = re.sub(r'^-+|-+$', '', slug)
+            slug = slug.strip('-')
             
             # Step 7: If slug is still empty, use hash-based fallback
             if not slug or slug.strip() == '':
@@ -759,7 +942,6 @@ class StoryOrchestrator:
         Returns None if transliteration fails - never raises exceptions.
         This is non-blocking and will not break story creation if it fails.
         """
-        logger = logging.getLogger(__name__)
         
         try:
             from app.config import get_settings
@@ -827,7 +1009,6 @@ Return only the transliterated text in English (Roman script), no explanations:
             
         except Exception as e:
             # Catch ALL exceptions to prevent breaking the story creation
-            logger = logging.getLogger(__name__)
             logger.warning("⚠️ Transliteration failed with exception: %s (type: %s)", str(e)[:200], type(e).__name__)
             # Don't re-raise - return None to use fallback
             return None
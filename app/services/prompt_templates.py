@@ -8,6 +8,7 @@ from app.domain.dto import AnalysisReport, PromptTemplateInfo, RenderedPrompt
 from app.domain.interfaces import PromptTemplateService
 from app.prompts import get_prompt_config
 from app.prompts.registry import InvalidCategoryError, PromptNotFoundError, available_modes, render_prompt
+from app.utils import LRUCache
 
 
 class DefaultPromptTemplateService(PromptTemplateService):
@@ -51,10 +52,16 @@ class PromptSelectionError(Exception):
 
 
 class PromptSelectionController:
-    """Encapsulate selection logic for choosing prompts."""
+    """Encapsulate selection logic for choosing prompts.
 
-    def __init__(self, service: PromptTemplateService) -> None:
+    Rendered prompts are memoized per (mode, category, language, analysis text,
+    keywords); repeat requests reuse the same ``RenderedPrompt`` instance, which
+    downstream consumers treat as read-only.
+    """
+
+    def __init__(self, service: PromptTemplateService, cache_size: int = 256) -> None:
         self._service = service
+        self._cache = LRUCache(cache_size)
 
     def select_prompt(
         self,
@@ -66,8 +73,12 @@ class PromptSelectionController:
         keywords: Sequence[str],
     ) -> RenderedPrompt:
         analysis_text = self._build_analysis_text(analysis)
+        cache_key = (mode, category, language, analysis_text, tuple(keywords))
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            return self._service.get_prompt(
+            rendered = self._service.get_prompt(
                 mode=mode,
                 category=category,
                 language=language,
@@ -76,6 +87,8 @@ class PromptSelectionController:
             )
         except (PromptNotFoundError, InvalidCategoryError) as exc:  # pragma: no cover - defensive
             raise PromptSelectionError(str(exc)) from exc
+        self._cache.put(cache_key, rendered)
+        return rendered
 
     def _build_analysis_text(self, report: AnalysisReport) -> str:
         segments: list[str] = []
@@ -15,6 +15,10 @@ class SmartInputDetector:
         r'www\.[^\s]+',      # www.example.com
         r'[a-zA-Z0-9-]+\.[a-zA-Z]{2,}[^\s]*',  # example.com/article
     ]
+    # One leftmost-first scan over all patterns; a bare-domain match can no longer
+    # start inside a URL the earlier patterns already matched.
+    URL_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in URL_PATTERNS))
+    WHITESPACE_RE = re.compile(r'\s+')
 
     def detect(self, user_input: str) -> Tuple[str, dict]:
         """
@@ -51,44 +55,27 @@ class SmartInputDetector:
 
     def _extract_urls(self, text: str) -> list[str]:
         """Extract all URLs from text."""
-        urls = []
-        for pattern in self.URL_PATTERNS:
-            matches = re.findall(pattern, text)
-            urls.extend(matches)
-
-        # Validate and normalize URLs
         validated = []
-        for url in urls:
-            # Normalize URLs without protocol
+        for url in self.URL_RE.findall(text):
+            # Normalize URLs without protocol (www.example.com, example.com/article)
             if not url.startswith(('http://', 'https://')):
-                if url.startswith('www.'):
-                    url = 'https://' + url
-                elif '.' in url and not url.startswith('file://'):
-                    # Try to validate as domain
-                    try:
-                        parsed = urlparse('https://' + url)
-                        if parsed.netloc:
-                            url = 'https://' + url
-                    except:
-                        continue
+                url = 'https://' + url
 
             # Validate URL
             try:
                 parsed = urlparse(url)
-                if parsed.netloc and parsed.scheme in ('http', 'https'):
-                    validated.append(url)
-            except:
+            except ValueError:
                 continue
+            if parsed.netloc and parsed.scheme in ('http', 'https'):
+                validated.append(url)
 
-        return list(set(validated))  # Remove duplicates
+        return list(dict.fromkeys(validated))  # Remove duplicates, keep first-seen order
 
     def _remove_urls(self, text: str) -> str:
         """Remove URLs from text, keep remaining content."""
-        for pattern in self.URL_PATTERNS:
-            text = re.sub(pattern, '', text)
+        text = self.URL_RE.sub('', text)
         # Clean up extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        return self.WHITESPACE_RE.sub(' ', text).strip()
 
     def _is_file_reference(self, text: str) -> bool:
         """Check if input is a file path/reference."""
@@ -2,7 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Optional, Protocol
+from functools import lru_cache
+from html import escape
+from typing import Iterable, NamedTuple, Optional, Protocol
+
+
+class SlideSpec(NamedTuple):
+    """Inputs for one generated slide."""
+
+    paragraph: str
+    audio_url: str
+    background_image_url: Optional[str] = None
+    slide_id: str = "slide"
 
 
 class TemplateSlideGenerator(Protocol):
@@ -18,26 +29,16 @@ class TemplateSlideGenerator(Protocol):
         """Generate AMP slide HTML for this template."""
         ...
 
+    def generate_deck(self, slides: Iterable[SlideSpec]) -> str:
+        """Generate the newline-separated AMP HTML for a run of slides."""
+        ...
 
-class TestNews1SlideGenerator:
-    """Generator for test-news-1 template."""
 
-    def generate_slide(
-        self,
-        paragraph: str,
-        audio_url: str,
-        background_image_url: Optional[str] = None,
-        slide_id: str = "slide",
-    ) -> str:
-        """Generate AMP slide for test-news-1 template."""
-        # Default background image if none provided
-        if not background_image_url:
-            background_image_url = "https://media.suvichaar.org/upload/polaris/polarisslide.png"
-
-        # Escape HTML in paragraph
-        paragraph_escaped = paragraph.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+DEFAULT_BACKGROUND_IMAGE_URL = "https://media.suvichaar.org/upload/polaris/polarisslide.png"
 
-        return f"""
+# Slide markup is kept at module scope and filled with str.format_map, so each
+# slide costs one C-level format call instead of rebuilding the whole f-string.
+_TEST_NEWS_1_SLIDE_TEMPLATE = """
       <amp-story-page id="{slide_id}" auto-advance-after="{slide_id}-audio">
         <amp-story-grid-layer template="fill">
           <amp-img src="{background_image_url}"
@@ -53,7 +54,7 @@ class TestNews1SlideGenerator:
           <div class="centered-container">
             
             <div class="text1">
-              {paragraph_escaped}
+              {paragraph}
             </div>
            <div class="footer"><p>©SuvichaarAI</p></div>
           </div>
@@ -61,27 +62,9 @@ class TestNews1SlideGenerator:
       </amp-story-page>
         """
 
-
-class TestNews2SlideGenerator:
-    """Generator for test-news-2 template (temporary - same as test-news-1)."""
-
-    def generate_slide(
-        self,
-        paragraph: str,
-        audio_url: str,
-        background_image_url: Optional[str] = None,
-        slide_id: str = "slide",
-    ) -> str:
-        """Generate AMP slide for test-news-2 template (temporary implementation)."""
-        # For now, use same structure as test-news-1
-        # TODO: Update with test-news-2 specific structure later
-        if not background_image_url:
-            background_image_url = "https://media.suvichaar.org/upload/polaris/polarisslide.png"
-
-        # Escape HTML in paragraph
-        paragraph_escaped = paragraph.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-
-        return f"""
+# test-news-2 currently mirrors test-news-1 (minus the spacer line).
+# TODO: Update with test-news-2 specific structure later
+_TEST_NEWS_2_SLIDE_TEMPLATE = """
       <amp-story-page id="{slide_id}" auto-advance-after="{slide_id}-audio">
         <amp-story-grid-layer template="fill">
           <amp-img src="{background_image_url}"
@@ -96,7 +79,7 @@ class TestNews2SlideGenerator:
         <amp-story-grid-layer template="vertical">
           <div class="centered-container">
             <div class="text1">
-              {paragraph_escaped}
+              {paragraph}
             </div>
            <div class="footer"><p>©SuvichaarAI</p></div>
           </div>
@@ -104,26 +87,7 @@ class TestNews2SlideGenerator:
       </amp-story-page>
         """
 
-
-class CuriousTemplate2SlideGenerator:
-    """Generator for curious-template-2 template (dynamic slide generation)."""
-
-    def generate_slide(
-        self,
-        paragraph: str,
-        audio_url: str,
-        background_image_url: Optional[str] = None,
-        slide_id: str = "slide",
-    ) -> str:
-        """Generate AMP slide for curious-template-2 template."""
-        # Default background image if none provided
-        if not background_image_url:
-            background_image_url = "https://media.suvichaar.org/upload/polaris/polarisslide.png"
-
-        # Escape HTML in paragraph
-        paragraph_escaped = paragraph.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-
-        return f"""
+_CURIOUS_TEMPLATE_2_SLIDE_TEMPLATE = """
       <amp-story-page id="{slide_id}" auto-advance-after="{slide_id}-audio">
         <amp-story-grid-layer template="fill">
           <amp-img src="{background_image_url}"
@@ -139,7 +103,7 @@ class CuriousTemplate2SlideGenerator:
           <div class="centered-container">
             <div class="header">📘 Notes Chapter</div>
             <div class="text1">
-              {paragraph_escaped}
+              {paragraph}
             </div>
            <div class="footer"><p>&copy;ABC Classes</p></div>
           </div>
@@ -148,6 +112,88 @@ class CuriousTemplate2SlideGenerator:
         """
 
 
+def _render_slide(
+    template: str,
+    paragraph: str,
+    audio_url: str,
+    background_image_url: Optional[str],
+    slide_id: str,
+) -> str:
+    """Fill a slide template, escaping the paragraph and defaulting the background."""
+    # Escape HTML in paragraph (text content only, so quotes are left alone)
+    paragraph_escaped = escape(paragraph, quote=False)
+    return template.format_map(
+        {
+            "slide_id": slide_id,
+            "background_image_url": background_image_url or DEFAULT_BACKGROUND_IMAGE_URL,
+            "audio_url": audio_url,
+            "paragraph": paragraph_escaped,
+        }
+    )
+
+
+def _render_deck(template: str, slides: Iterable[SlideSpec]) -> str:
+    """Render every slide into one string with a single join."""
+    return "\n".join(
+        _render_slide(template, slide.paragraph, slide.audio_url, slide.background_image_url, slide.slide_id)
+        for slide in slides
+    )
+
+
+class TestNews1SlideGenerator:
+    """Generator for test-news-1 template."""
+
+    def generate_slide(
+        self,
+        paragraph: str,
+        audio_url: str,
+        background_image_url: Optional[str] = None,
+        slide_id: str = "slide",
+    ) -> str:
+        """Generate AMP slide for test-news-1 template."""
+        return _render_slide(_TEST_NEWS_1_SLIDE_TEMPLATE, paragraph, audio_url, background_image_url, slide_id)
+
+    def generate_deck(self, slides: Iterable[SlideSpec]) -> str:
+        """Generate the middle slides of a deck in one pass."""
+        return _render_deck(_TEST_NEWS_1_SLIDE_TEMPLATE, slides)
+
+
+class TestNews2SlideGenerator:
+    """Generator for test-news-2 template (temporary - same as test-news-1)."""
+
+    def generate_slide(
+        self,
+        paragraph: str,
+        audio_url: str,
+        background_image_url: Optional[str] = None,
+        slide_id: str = "slide",
+    ) -> str:
+        """Generate AMP slide for test-news-2 template (temporary implementation)."""
+        return _render_slide(_TEST_NEWS_2_SLIDE_TEMPLATE, paragraph, audio_url, background_image_url, slide_id)
+
+    def generate_deck(self, slides: Iterable[SlideSpec]) -> str:
+        """Generate the middle slides of a deck in one pass."""
+        return _render_deck(_TEST_NEWS_2_SLIDE_TEMPLATE, slides)
+
+
+class CuriousTemplate2SlideGenerator:
+    """Generator for curious-template-2 template (dynamic slide generation)."""
+
+    def generate_slide(
+        self,
+        paragraph: str,
+        audio_url: str,
+        background_image_url: Optional[str] = None,
+        slide_id: str = "slide",
+    ) -> str:
+        """Generate AMP slide for curious-template-2 template."""
+        return _render_slide(_CURIOUS_TEMPLATE_2_SLIDE_TEMPLATE, paragraph, audio_url, background_image_url, slide_id)
+
+    def generate_deck(self, slides: Iterable[SlideSpec]) -> str:
+        """Generate the middle slides of a deck in one pass."""
+        return _render_deck(_CURIOUS_TEMPLATE_2_SLIDE_TEMPLATE, slides)
+
+
 # Template Registry
 TEMPLATE_GENERATORS: dict[str, TemplateSlideGenerator] = {
     "test-news-1": TestNews1SlideGenerator(),
@@ -156,6 +202,20 @@ TEMPLATE_GENERATORS: dict[str, TemplateSlideGenerator] = {
 }
 
 
+@lru_cache(maxsize=128)
+def _resolve_base_name(template_key: str) -> str:
+    """Reduce a template key (name, URL or S3 path) to its base template name."""
+    # If URL, extract filename
+    if template_key.startswith(("http://", "https://")):
+        # Extract filename from URL
+        return template_key.split("/")[-1].replace(".html", "")
+    if template_key.startswith("s3://"):
+        # Extract filename from S3 path
+        return template_key.split("/")[-1].replace(".html", "")
+    # File name - remove extension if present
+    return template_key.replace(".html", "")
+
+
 def get_slide_generator(template_key: str) -> TemplateSlideGenerator:
     """
     Get template-specific slide generator.
@@ -165,20 +225,5 @@ def get_slide_generator(template_key: str) -> TemplateSlideGenerator:
     - URLs: "https://example.com/test-news-1.html" → extracts "test-news-1"
     - S3: "s3://bucket/test-news-1.html" → extracts "test-news-1"
     """
-    # Extract base template name
-    base_name = template_key
-
-    # If URL, extract filename
-    if template_key.startswith(("http://", "https://")):
-        # Extract filename from URL
-        base_name = template_key.split("/")[-1].replace(".html", "")
-    elif template_key.startswith("s3://"):
-        # Extract filename from S3 path
-        base_name = template_key.split("/")[-1].replace(".html", "")
-    else:
-        # File name - remove extension if present
-        base_name = template_key.replace(".html", "")
-
-    # Get generator or default to test-news-1
-    return TEMPLATE_GENERATORS.get(base_name, TestNews1SlideGenerator())
-
+    # Generators are stateless, so unknown keys share the test-news-1 instance
+    return TEMPLATE_GENERATORS.get(_resolve_base_name(template_key), TEMPLATE_GENERATORS["test-news-1"])
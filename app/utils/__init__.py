@@ -1,6 +1,6 @@
 """Utility helpers."""
 
+from .cache import LRUCache
 from .placeholders import is_placeholder_value
 
-__all__ = ["is_placeholder_value"]
-
+__all__ = ["LRUCache", "is_placeholder_value"]
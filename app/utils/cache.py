@@ -0,0 +1,46 @@
+"""Small in-process cache shared by the service layer."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+class LRUCache:
+    """Thread-safe LRU mapping; entries optionally expire after ``ttl`` seconds.
+
+    ``get`` returns ``None`` on a miss, so ``None`` itself is never cached.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value) -> None:
+        if self._maxsize <= 0 or value is None:
+            return
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,4 +1,4 @@
-import os, io, re, json, time, uuid, base64, zipfile, random, string, textwrap
+import os, io, re, json, time, uuid, base64, zipfile, random, secrets, string, textwrap
 from io import BytesIO
 from pathlib import Path
 from urllib.parse import urlparse
@@ -155,9 +155,8 @@ def generate_slug_and_urls(title):
     slug = re.sub(r'^-+|-+$', '', slug)  # Remove leading or trailing hyphens
     
     # Step 2: Generate a Nano ID (matching JavaScript Canurl function)
-    alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-'
-    size = 10
-    nano_id = ''.join(random.choices(alphabet, k=size))
+    # token_urlsafe draws from the same A-Za-z0-9_- alphabet; 8 random bytes cover 10 characters
+    nano_id = secrets.token_urlsafe(8)[:10]
     nano = nano_id + "_G"
     
     slug_nano = f"{slug}_{nano}"
@@ -113,3 +113,67 @@ DATABASE_URL = "sqlite:///tmp.db"
     assert settings.aws.bucket == "env-bucket"
     assert settings.database.url == "sqlite:///env.db"
 
+
+MINIMAL_CONFIG = """
+[azure_api]
+AZURE_OPENAI_ENDPOINT = "https://example.com"
+AZURE_OPENAI_API_KEY = "key"
+AZURE_OPENAI_DEPLOYMENT = "deployment"
+AZURE_OPENAI_API_VERSION = "version"
+
+[azure_speech]
+AZURE_SPEECH_KEY = "speechkey"
+AZURE_SPEECH_REGION = "eastus"
+VOICE_NAME = "voice"
+
+[azure_di]
+AZURE_DI_ENDPOINT = "https://di"
+AZURE_DI_KEY = "dikey"
+
+[aws]
+AWS_ACCESS_KEY = "aws-access"
+AWS_SECRET_KEY = "aws-secret"
+AWS_REGION = "region"
+AWS_BUCKET = "bucket"
+S3_PREFIX = "prefix"
+CDN_PREFIX_MEDIA = "media"
+CDN_HTML_BASE = "html-base"
+CDN_BASE = "base"
+"""
+
+
+def test_cache_settings_default_to_disabled(tmp_path: Path):
+    settings = load_settings(config_path=write_config(tmp_path / "settings.toml", MINIMAL_CONFIG))
+
+    assert settings.cache.curious_response_size == 0
+    assert settings.cache.story_requests is False
+
+
+def test_cache_settings_env_override_is_validated(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    config_path = write_config(tmp_path / "settings.toml", MINIMAL_CONFIG)
+
+    monkeypatch.setenv("CURIOUS_RESPONSE_CACHE_SIZE", "64")
+    assert load_settings(config_path=config_path).cache.curious_response_size == 64
+
+    monkeypatch.setenv("CURIOUS_RESPONSE_CACHE_SIZE", "-1")
+    with pytest.raises(ValueError):
+        load_settings(config_path=config_path)
+
+
+def test_story_request_cache_settings_from_toml(tmp_path: Path):
+    config_path = write_config(
+        tmp_path / "settings.toml",
+        MINIMAL_CONFIG
+        + """
+[cache]
+STORY_REQUEST_CACHE = true
+STORY_REQUEST_CACHE_SIZE = 16
+STORY_REQUEST_CACHE_TTL = 30
+""",
+    )
+
+    settings = load_settings(config_path=config_path)
+
+    assert settings.cache.story_requests is True
+    assert settings.cache.story_request_size == 16
+    assert settings.cache.story_request_ttl_seconds == 30.0
@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import uuid4
 
+import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -94,3 +95,21 @@ def test_story_repository_updates_existing_record():
     assert fetched.category == "History"
     assert fetched.prompt_news == "updated news"
 
+
+
+def test_story_repository_get_by_canurls_prefers_earlier_candidates():
+    repo, _ = make_repository()
+    exact = make_story_record().model_copy(
+        update={"id": uuid4(), "canurl": "https://story/slug_1", "canurl1": "https://story/slug_1.html"}
+    )
+    partial = make_story_record().model_copy(
+        update={"id": uuid4(), "canurl": "https://story/other-slug_1", "canurl1": "https://story/other-slug_1.html"}
+    )
+    repo.save(partial)
+    repo.save(exact)
+
+    fetched = repo.get_by_canurls(["https://story/slug_1", "https://story/slug_1.html", "slug_1"])
+
+    assert fetched.id == exact.id
+    with pytest.raises(KeyError):
+        repo.get_by_canurls(["https://story/missing", "missing"])
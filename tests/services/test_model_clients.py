@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 
+import pytest
+
 from app.domain.dto import CuriousNarrative, DocInsights, Entity, RenderedPrompt, SemanticChunk
 from app.services.model_clients import CuriousModelClient, LanguageModel, NewsModelClient
 
@@ -66,3 +69,272 @@ def test_news_model_client_generates_headlines_and_bullets():
     assert narrative.slide_deck.template_key == "news_default"
     assert "Context:" in lm.calls[0][1]
 
+
+
+def test_curious_parse_json_response_handles_code_fences_and_extra_text():
+    client = CuriousModelClient(language_model=StubLanguageModel(response=""))
+
+    assert client._parse_json_response('{"storytitle": "नमस्ते"}') == {"storytitle": "नमस्ते"}
+    assert client._parse_json_response('```json\n{"a": 1}\n```') == {"a": 1}
+    assert client._parse_json_response('Here you go: {"a": 2} thanks') == {"a": 2}
+    assert client._parse_json_response("not json") == {}
+
+
+def test_clean_markdown_strips_formatting():
+    curious = CuriousModelClient(language_model=StubLanguageModel(response=""))
+    news = NewsModelClient(language_model=StubLanguageModel(response=""))
+    text = "## Title\n**Bold** and *italic* with `code` and [link](http://x.y)\n---\n\n\n\nEnd"
+
+    assert curious._clean_markdown(text) == "Title\nBold and italic with code and link\n\nEnd"
+    assert news._clean_markdown(text) == "Title Bold and italic with code and link --- End"
+    assert curious._clean_markdown("  plain text  ") == "plain text"
+    assert news._clean_markdown("") == ""
+
+
+def test_curious_system_prompt_keeps_request_values_after_static_prefix():
+    from app.services.model_clients import _CURIOUS_PROMPT_STATIC, _build_curious_system_prompt
+
+    hindi = _build_curious_system_prompt("hi", 5)
+    english = _build_curious_system_prompt("en", 8)
+
+    assert hindi.startswith(_CURIOUS_PROMPT_STATIC)
+    assert english.startswith(_CURIOUS_PROMPT_STATIC)
+    assert '"s8paragraph1"' in english and '"s8paragraph1"' not in hindi
+
+
+def test_curious_translates_missing_alts_in_one_batched_call():
+    class TranslatingLanguageModel:
+        def __init__(self):
+            self.calls: list[tuple[str, str]] = []
+
+        def complete(self, system_prompt: str, user_prompt: str) -> str:
+            self.calls.append((system_prompt, user_prompt))
+            if system_prompt.startswith("You are a translator"):
+                return '{"s0": "A cricket team lifting a trophy", "s1": "Fans cheering in a packed stadium"}'
+            return '{"storytitle": "भारत ने फाइनल जीता", "s1paragraph1": "प्रशंसकों ने खुशी मनाई"}'
+
+    lm = TranslatingLanguageModel()
+    client = CuriousModelClient(language_model=lm)
+    prompt = RenderedPrompt(system="", user="", metadata={"language": "hi"})
+
+    narrative = client.generate(prompt, make_insights(), slide_count=3)
+
+    translator_calls = [call for call in lm.calls if call[0].startswith("You are a translator")]
+    assert len(translator_calls) == 1
+    assert "Cover illustration for story about A cricket team lifting a trophy" in narrative.raw_output
+    assert "Fans cheering in a packed stadium — Flat vector illustration" in narrative.raw_output
+
+
+def test_news_generate_stream_yields_title_then_narrations_in_order():
+    lm = StubLanguageModel(response="Narration")
+    client = NewsModelClient(language_model=lm)
+
+    stream = client.generate_stream(make_prompt("news"), make_insights(), slide_count=4)
+
+    assert next(stream) == "Narration"
+    assert list(stream) == ["Narration", "Narration"]
+
+
+def test_news_generate_keeps_generated_storytitle_in_headlines():
+    lm = StubLanguageModel(response="Narration")
+    client = NewsModelClient(language_model=lm)
+    client._generate_storytitle = lambda article_text, content_language, slide_count: "**Big** news"
+
+    narrative = client.generate(make_prompt("news"), make_insights(), slide_count=4)
+
+    assert narrative.headlines == ["**Big** news"]
+    assert narrative.slide_deck.slides[0].text == "Big news"
+    assert narrative.bullet_points == ["Narration", "Narration"]
+
+
+def test_news_url_keywords_skip_section_words_ids_and_extensions():
+    lm = StubLanguageModel(response="Narration")
+    client = NewsModelClient(language_model=lm)
+    insights = DocInsights(
+        semantic_chunks=[
+            SemanticChunk(
+                id="chunk-1",
+                text="India won the cricket final at the stadium in front of a large crowd of fans.",
+                source_id="https://example.com/sports/cricket/india-wins-final-at-stadium-20240101.html",
+            )
+        ]
+    )
+
+    client.generate(make_prompt("news"), insights, slide_count=3)
+
+    assert any(
+        "URL contains these keywords: india, wins, final, stadium." in user_prompt
+        for _, user_prompt in lm.calls
+    )
+
+
+def test_news_classifies_article_within_the_slide_structure_call():
+    lm = StubLanguageModel(response="Narration")
+    client = NewsModelClient(language_model=lm)
+
+    client.generate(make_prompt("news"), make_insights(), slide_count=3)
+
+    assert not any(system.startswith("Classify the news") for system, _ in lm.calls)
+    structure_calls = [call for call in lm.calls if "Google Web Story" in call[0]]
+    assert len(structure_calls) == 1
+    assert '"emotion"' in structure_calls[0][0]
+    assert "Category: infer from the article" in structure_calls[0][1]
+
+
+def test_news_skips_classification_when_caller_supplies_all_values():
+    lm = StubLanguageModel(response="Narration")
+    client = NewsModelClient(language_model=lm)
+
+    client.generate(
+        make_prompt("news"), make_insights(), slide_count=3,
+        category="Sports", subcategory="Cricket", emotion=" ",
+    )
+    structure_call = next(call for call in lm.calls if "Google Web Story" in call[0])
+    assert "Emotion: infer from the article" in structure_call[1]
+
+    lm.calls.clear()
+    client.generate(
+        make_prompt("news"), make_insights(), slide_count=3,
+        category="Sports", subcategory="Cricket", emotion="Joy",
+    )
+    structure_call = next(call for call in lm.calls if "Google Web Story" in call[0])
+    assert '"emotion"' not in structure_call[0]
+    assert "Category: Sports" in structure_call[1]
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_news_filter_positive_content_drops_negative_sentences(monkeypatch, use_automaton):
+    import app.services.model_clients as model_clients
+
+    if use_automaton and not model_clients.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick not installed")
+    monkeypatch.setattr(model_clients, "AHOCORASICK_AVAILABLE", use_automaton)
+    client = NewsModelClient(language_model=StubLanguageModel(response=""))
+    # Native-script keywords only: English words are caught before either matcher runs
+    text = (
+        "शहर में इस सप्ताह एक नया सार्वजनिक पुस्तकालय खुला। "
+        "रात में पुराने बाज़ार के पास एक दुर्घटना हुई। "
+        "निवासियों ने पुस्तकालय के लंबे समय तक खुले रहने का स्वागत किया। "
+        "बच्चों ने पार्क में पढ़ने के उत्सव का आनंद लिया।"
+    )
+
+    filtered = client._filter_positive_content(text)
+
+    assert "दुर्घटना" not in filtered
+    assert "नया सार्वजनिक पुस्तकालय" in filtered
+    assert "पढ़ने के उत्सव" in filtered
+
+
+def test_negative_keyword_automata_match_the_regex_fallback(monkeypatch):
+    import app.services.model_clients as model_clients
+
+    if not model_clients.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick not installed")
+    samples = {
+        script: [f"समाचार {keyword}ों के बाद" for keyword in keywords]
+        + [f"{keyword[1:]} {keyword[:-1]}" for keyword in keywords]
+        + ["शहर में नया पुस्तकालय खुला", "ਸ਼ਹਿਰ ਵਿੱਚ ਨਵੀਂ ਲਾਇਬ੍ਰੇਰੀ", "நகரில் புதிய நூலகம்"]
+        for script, keywords in model_clients.NEGATIVE_KEYWORDS_BY_SCRIPT.items()
+    }
+
+    def scan(use_automaton: bool) -> dict[str, list[bool]]:
+        monkeypatch.setattr(model_clients, "AHOCORASICK_AVAILABLE", use_automaton)
+        return {
+            script: [model_clients._contains_negative_keyword(sentence, script) for sentence in sentences]
+            for script, sentences in samples.items()
+        }
+
+    with_automaton = scan(True)
+    with_fallback = scan(False)
+
+    assert with_automaton == with_fallback
+    for script, keywords in model_clients.NEGATIVE_KEYWORDS_BY_SCRIPT.items():
+        assert all(with_automaton[script][: len(keywords)])
+        assert not any(with_automaton[script][-3:])
+
+
+def test_news_filter_matches_english_keywords_as_whole_words():
+    client = NewsModelClient(language_model=StubLanguageModel(response=""))
+    text = (
+        "The startup won an award for its pharmacy software. "
+        "Work has begun on the riverside park before the deadline. "
+        "Two people were injured when the bridge railing gave way."
+    )
+
+    filtered = client._filter_positive_content(text)
+
+    assert "award" in filtered
+    assert "deadline" in filtered
+    assert "injured" not in filtered
+
+
+def test_news_narration_truncates_at_word_boundary_or_hard_cuts_long_words():
+    lm = StubLanguageModel(response="Crowds gathered early at the riverside to watch the festival fireworks")
+    client = NewsModelClient(language_model=lm)
+
+    narration = client._generate_slide_narration({"summary": "Festival"}, 2, "English", 30)
+    assert narration == "Crowds gathered early at the…"
+
+    lm.response = "あ" * 50
+    narration = client._generate_slide_narration({"summary": "Festival"}, 2, "Japanese", 30)
+    assert narration == "あ" * 29 + "…"
+
+
+def test_news_slide_structure_parses_json_wrapped_in_prose():
+    lm = StubLanguageModel(
+        response='Sure! Here is the structure:\n```json\n{"slides": [{"title": "Opening day"}]}\n```'
+    )
+    client = NewsModelClient(language_model=lm)
+
+    slides = client._generate_slide_structure("Article text", "News", "General", "Neutral", "English", 1)
+
+    assert slides == [{"title": "Opening day"}]
+
+
+def test_curious_parse_json_response_falls_back_to_first_fenced_object():
+    client = CuriousModelClient(language_model=StubLanguageModel(response=""))
+    raw = 'Draft:\n```json\n{"storytitle": "One"}\n```\nNote: braces like {this} are ignored.'
+
+    assert client._parse_json_response(raw) == {"storytitle": "One"}
+
+
+def test_clean_markdown_drops_unpaired_markers():
+    curious = CuriousModelClient(language_model=StubLanguageModel(response=""))
+    news = NewsModelClient(language_model=StubLanguageModel(response=""))
+
+    assert curious._clean_markdown("Score ** update with `tick") == "Score  update with tick"
+    assert news._clean_markdown("Score ** update with `tick") == "Score update with tick"
+
+
+def test_curious_narrative_carries_parsed_output_matching_raw_output():
+    lm = StubLanguageModel(response='{"storytitle": "Parsed", "s1paragraph1": "Body", "s1alt1": "Alt", "s0alt1": "Cover"}')
+    client = CuriousModelClient(language_model=lm)
+
+    narrative = client.generate(make_prompt("curious"), make_insights(), slide_count=3)
+
+    assert narrative.parsed_output == json.loads(narrative.raw_output)
+    assert narrative.parsed_output["s1alt1"] == "Alt"
+    assert "parsed_output" not in narrative.model_dump()
+
+
+def test_curious_response_cache_skips_repeat_llm_calls():
+    lm = StubLanguageModel(response='{"storytitle": "Cached", "s1paragraph1": "Body", "s1alt1": "Alt", "s0alt1": "Cover"}')
+    client = CuriousModelClient(language_model=lm, response_cache_size=4)
+    prompt = make_prompt("curious")
+
+    first = client.generate(prompt, make_insights(), slide_count=3)
+    second = client.generate(prompt, make_insights(), slide_count=3)
+
+    assert len(lm.calls) == 1
+    assert second.raw_output == first.raw_output
+
+
+def test_curious_response_cache_disabled_by_default():
+    lm = StubLanguageModel(response='{"storytitle": "Fresh", "s1paragraph1": "Body", "s1alt1": "Alt", "s0alt1": "Cover"}')
+    client = CuriousModelClient(language_model=lm)
+    prompt = make_prompt("curious")
+
+    client.generate(prompt, make_insights(), slide_count=3)
+    client.generate(prompt, make_insights(), slide_count=3)
+
+    assert len(lm.calls) == 2
@@ -0,0 +1,447 @@
+from __future__ import annotations
+
+import json
+import logging
+import sys
+import threading
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from app.api.schemas import StoryCreateRequest
+from app.domain.dto import ImageAsset, Mode, VoiceAsset
+from app.services.analysis import CompositeAnalysisFacade, HeuristicFunctionAnalyzer, PromptRecommendationAnalyzer
+from app.services.document_intelligence import DefaultDocumentIntelligencePipeline
+from app.services.ingestion import DefaultIngestionAggregator
+from app.services.language_detection import DefaultLanguageDetectionService
+from app.services.model_clients import CuriousModelClient, NewsModelClient
+from app.services.model_router import DefaultModelRouter
+from app.services import orchestrator as orchestrator_module
+from app.services.orchestrator import StoryOrchestrator
+from app.services.prompt_templates import DefaultPromptTemplateService, PromptSelectionController
+from app.services.user_input import DefaultUserInputService
+from app.utils import cache as cache_module
+
+
+class StubLanguageModel:
+    def __init__(self):
+        self.calls = 0
+
+    def complete(self, system_prompt: str, user_prompt: str) -> str:
+        self.calls += 1
+        return json.dumps(
+            {
+                "storytitle": "AI Art Today",
+                "s0alt1": "cover",
+                **{f"s{i}paragraph1": f"Para {i} about art." for i in range(1, 9)},
+                **{f"s{i}alt1": f"Alt {i} image prompt" for i in range(1, 9)},
+            }
+        )
+
+
+class StubLanguageStrategy:
+    def detect(self, text: str):
+        return ("en", 0.9)
+
+
+class StubImagePipeline:
+    def process(self, deck, payload, article_images=None):
+        return []
+
+
+class StubVoiceService:
+    def synthesize(self, deck, language, provider):
+        return []
+
+
+class StubRepository:
+    def __init__(self):
+        self.saved = []
+
+    def save(self, record):
+        self.saved.append(record)
+
+    def get(self, story_id):
+        raise KeyError(story_id)
+
+
+class GatedRepository(StubRepository):
+    """Repository whose saves block until the test opens the gate."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+
+    def save(self, record):
+        assert self.gate.wait(timeout=5)
+        super().save(record)
+
+
+class FailingRepository(StubRepository):
+    def save(self, record):
+        raise RuntimeError("database is down")
+
+
+class StubRenderer:
+    def __init__(self):
+        self.rendered = []
+        self.written = []
+
+    def render(self, record, template_key, template_source="file", image_source=None):
+        self.rendered.append(record.id)
+        return f"<html>{record.id}</html>"
+
+    def save_html_to_file(self, html_content, story_id, output_dir=None):
+        self.written.append(story_id)
+        return f"/tmp/{story_id}.html"
+
+
+def make_orchestrator(language_model: StubLanguageModel, repository=None, **overrides) -> StoryOrchestrator:
+    ids = iter(UUID(int=i) for i in range(1, 1000))
+    router = DefaultModelRouter(
+        {
+            Mode.CURIOUS: CuriousModelClient(language_model=language_model),
+            Mode.NEWS: NewsModelClient(language_model=language_model),
+        }
+    )
+    return StoryOrchestrator(
+        user_input_service=DefaultUserInputService(),
+        language_service=DefaultLanguageDetectionService(strategy=StubLanguageStrategy()),
+        ingestion_aggregator=DefaultIngestionAggregator(),
+        doc_pipeline=DefaultDocumentIntelligencePipeline(ocr_adapters=[], parser_adapters=[], url_extractor=None),
+        analysis_facade=CompositeAnalysisFacade([HeuristicFunctionAnalyzer(), PromptRecommendationAnalyzer()]),
+        prompt_controller=PromptSelectionController(DefaultPromptTemplateService()),
+        model_router=router,
+        image_pipeline=StubImagePipeline(),
+        voice_service=StubVoiceService(),
+        repository=repository if repository is not None else StubRepository(),
+        id_factory=lambda: next(ids),
+        **overrides,
+    )
+
+
+def make_request(text_prompt: str = "Tell me about AI art and how artists use new tools.", **overrides) -> StoryCreateRequest:
+    fields = dict(
+        mode="curious",
+        template_key="modern",
+        slide_count=4,
+        category="Art",
+        text_prompt=text_prompt,
+        prompt_keywords=["AI", "art"],
+        image_source="ai",
+    )
+    fields.update(overrides)
+    return StoryCreateRequest(**fields)
+
+
+def test_identical_requests_reuse_generated_story():
+    lm = StubLanguageModel()
+    repository = StubRepository()
+    orchestrator = make_orchestrator(lm, repository, cache_identical_requests=True)
+
+    first = orchestrator.create_story(make_request())
+    calls_after_first = lm.calls
+    second = orchestrator.create_story(make_request())
+
+    assert calls_after_first > 0
+    assert lm.calls == calls_after_first
+    assert second.id != first.id
+    assert second.slide_deck == first.slide_deck
+    assert [record.id for record in repository.saved] == [first.id, second.id]
+
+
+def test_cached_story_expires_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    lm = StubLanguageModel()
+    orchestrator = make_orchestrator(lm, cache_identical_requests=True, request_cache_ttl=60.0)
+
+    orchestrator.create_story(make_request())
+    calls_after_first = lm.calls
+    now[0] += 61.0
+    orchestrator.create_story(make_request())
+
+    assert lm.calls == 2 * calls_after_first
+
+
+def test_different_payloads_get_different_cache_entries():
+    lm = StubLanguageModel()
+    orchestrator = make_orchestrator(lm, cache_identical_requests=True)
+
+    orchestrator.create_story(make_request())
+    calls_after_first = lm.calls
+    orchestrator.create_story(make_request(text_prompt="Explain how volcanoes form under the ocean floor."))
+    orchestrator.create_story(make_request(slide_count=6))
+
+    assert lm.calls == 3 * calls_after_first
+
+
+def test_force_refresh_skips_cached_story():
+    lm = StubLanguageModel()
+    orchestrator = make_orchestrator(lm, cache_identical_requests=True)
+
+    orchestrator.create_story(make_request())
+    calls_after_first = lm.calls
+    orchestrator.create_story(make_request(force_refresh=True))
+    assert lm.calls == 2 * calls_after_first
+
+    # The refreshed story replaced the cached one, so a plain request hits it again
+    orchestrator.create_story(make_request())
+    assert lm.calls == 2 * calls_after_first
+
+
+def test_request_cache_is_off_by_default():
+    lm = StubLanguageModel()
+    orchestrator = make_orchestrator(lm)
+
+    orchestrator.create_story(make_request())
+    calls_after_first = lm.calls
+    orchestrator.create_story(make_request())
+
+    assert lm.calls == 2 * calls_after_first
+
+
+def test_background_publish_keeps_submission_order():
+    repository = StubRepository()
+    renderer = StubRenderer()
+    orchestrator = make_orchestrator(
+        StubLanguageModel(), repository, html_renderer=renderer, background_publish=True
+    )
+
+    records = [orchestrator.create_story(make_request(text_prompt=f"Story number {i} about AI art.")) for i in range(3)]
+    orchestrator.flush()
+
+    expected = [record.id for record in records]
+    assert [record.id for record in repository.saved] == expected
+    assert renderer.rendered == expected
+    assert renderer.written == expected
+    orchestrator.close()
+
+
+def test_flush_waits_for_pending_publish():
+    repository = GatedRepository()
+    orchestrator = make_orchestrator(StubLanguageModel(), repository, background_publish=True)
+
+    record = orchestrator.create_story(make_request())
+    assert repository.saved == []  # create_story returned before the save ran
+
+    threading.Timer(0.05, repository.gate.set).start()
+    orchestrator.flush()
+
+    assert [saved.id for saved in repository.saved] == [record.id]
+    orchestrator.close()
+
+
+def test_close_drains_queued_publishing():
+    repository = GatedRepository()
+    orchestrator = make_orchestrator(StubLanguageModel(), repository, background_publish=True)
+
+    records = [orchestrator.create_story(make_request(text_prompt=f"Story number {i} about AI art.")) for i in range(3)]
+    assert repository.saved == []
+
+    repository.gate.set()
+    orchestrator.close()
+
+    assert [saved.id for saved in repository.saved] == [record.id for record in records]
+    # Once closed, publishing runs inline on the caller's thread
+    late = orchestrator.create_story(make_request(text_prompt="A late story about AI art."))
+    assert repository.saved[-1].id == late.id
+
+
+def test_background_publish_failure_is_logged_and_worker_keeps_going(monkeypatch, caplog):
+    repository = StubRepository()
+    original_publish = StoryOrchestrator._publish
+    failed = []
+
+    def flaky_publish(self, record, image_source):
+        if not failed:
+            failed.append(record.id)
+            raise RuntimeError("renderer exploded")
+        return original_publish(self, record, image_source)
+
+    monkeypatch.setattr(StoryOrchestrator, "_publish", flaky_publish)
+    orchestrator = make_orchestrator(StubLanguageModel(), repository, background_publish=True)
+
+    with caplog.at_level(logging.WARNING, logger="app.services.orchestrator"):
+        first = orchestrator.create_story(make_request(text_prompt="First story about AI art."))
+        second = orchestrator.create_story(make_request(text_prompt="Second story about AI art."))
+        orchestrator.close()
+
+    assert failed == [first.id]
+    assert "Background story publishing failed" in caplog.text
+    assert "renderer exploded" in caplog.text
+    assert [saved.id for saved in repository.saved] == [second.id]
+
+
+def test_failed_database_save_is_logged_not_reported_as_saved(caplog):
+    renderer = StubRenderer()
+    orchestrator = make_orchestrator(StubLanguageModel(), FailingRepository(), html_renderer=renderer)
+
+    with caplog.at_level(logging.DEBUG, logger="app.services.orchestrator"):
+        record = orchestrator.create_story(make_request())
+
+    # The database write is non-critical: the story is still returned and its HTML published
+    assert renderer.written == [record.id]
+    assert "Failed to save story to database (non-critical): database is down" in caplog.text
+    assert "Story saved to database successfully" not in caplog.text
+    orchestrator.close()
+
+
+def test_save_worker_failure_propagates_from_create_story(monkeypatch):
+    def broken_save(self, record):
+        raise RuntimeError("save worker crashed")
+
+    monkeypatch.setattr(StoryOrchestrator, "_save_record", broken_save)
+    orchestrator = make_orchestrator(StubLanguageModel(), html_renderer=StubRenderer())
+
+    with pytest.raises(RuntimeError, match="save worker crashed"):
+        orchestrator.create_story(make_request())
+    orchestrator.close()
+
+
+class SlowImagePipeline:
+    """Finishes only after voice synthesis has, so the two stages complete out of order."""
+
+    def __init__(self, voice_done: threading.Event):
+        self.voice_done = voice_done
+
+    def process(self, deck, payload, article_images=None):
+        assert self.voice_done.wait(timeout=5)
+        return [
+            ImageAsset(source="ai", original_object_key=f"slide-{index}.png", description=slide.text)
+            for index, slide in enumerate(deck.slides)
+        ]
+
+
+class FastVoiceService:
+    def __init__(self, voice_done: threading.Event):
+        self.voice_done = voice_done
+
+    def synthesize(self, deck, language, provider):
+        assets = [
+            VoiceAsset(provider="stub", audio_url=f"https://cdn.example.com/slide-{index}.mp3")
+            for index, _ in enumerate(deck.slides)
+        ]
+        self.voice_done.set()
+        return assets
+
+
+def test_image_and_voice_assets_keep_slide_order_when_finishing_out_of_order(capsys):
+    voice_done = threading.Event()
+    orchestrator = make_orchestrator(StubLanguageModel())
+    orchestrator.image_pipeline = SlowImagePipeline(voice_done)
+    orchestrator.voice_service = FastVoiceService(voice_done)
+
+    record = orchestrator.create_story(make_request())
+
+    slides = record.slide_deck.slides
+    assert [asset.description for asset in record.image_assets] == [slide.text for slide in slides]
+    assert [str(asset.audio_url) for asset in record.voice_assets] == [
+        f"https://cdn.example.com/slide-{index}.mp3" for index in range(len(slides))
+    ]
+    assert capsys.readouterr().out == ""
+
+
+class StubS3Client:
+    def __init__(self):
+        self.uploads = []
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None, Config=None):
+        self.uploads.append((fileobj.read(), bucket, key, ExtraArgs, Config))
+
+
+def test_story_html_upload_uses_one_s3_client(monkeypatch):
+    boto3 = pytest.importorskip("boto3")
+    s3_client = StubS3Client()
+    created = []
+
+    def fake_client(service_name, **kwargs):
+        created.append(service_name)
+        return s3_client
+
+    aws = SimpleNamespace(access_key="key", secret_key="secret", region="eu-west-1")
+    monkeypatch.setattr(boto3, "client", fake_client)
+    monkeypatch.setitem(sys.modules, "app.config", SimpleNamespace(get_settings=lambda: SimpleNamespace(aws=aws)))
+    orchestrator = make_orchestrator(StubLanguageModel(), html_renderer=StubRenderer())
+
+    records = [orchestrator.create_story(make_request(text_prompt=f"Story number {i} about AI art.")) for i in range(2)]
+    orchestrator.close()
+
+    assert created == ["s3"]
+    assert len(s3_client.uploads) == 2
+    for record, (body, bucket, key, extra_args, config) in zip(records, s3_client.uploads):
+        assert body == f"<html>{record.id}</html>".encode("utf-8")
+        assert bucket == "suvichaarstories"
+        assert key == str(record.canurl1).split("suvichaar.org/stories/")[-1]
+        assert extra_args == {"ContentType": "text/html; charset=utf-8"}
+        assert config is orchestrator_module._HTML_SINGLE_PUT_TRANSFER_CONFIG
+
+
+class ExplodingStage:
+    """Stands in for any pipeline component; every call raises."""
+
+    def __getattr__(self, name):
+        def explode(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        return explode
+
+
+@pytest.mark.parametrize(
+    ("component", "message", "log_message"),
+    [
+        ("user_input_service", "Invalid request payload: boom", "Failed to build intake payload: boom"),
+        ("language_service", "Language detection failed: boom", "Language detection failed: boom"),
+        ("ingestion_aggregator", "Failed to aggregate job request: boom", "Job request aggregation failed: boom"),
+        ("analysis_facade", "Analysis failed: boom", "Analysis failed: boom"),
+        ("prompt_controller", "Prompt rendering failed: boom", "Prompt selection/rendering failed: boom"),
+        ("model_router", "Narrative generation failed: boom", "Narrative generation failed: boom"),
+    ],
+)
+def test_stage_failures_are_reported_per_stage(component, message, log_message, caplog):
+    orchestrator = make_orchestrator(StubLanguageModel())
+    setattr(orchestrator, component, ExplodingStage())
+
+    with caplog.at_level(logging.ERROR, logger="app.services.orchestrator"):
+        with pytest.raises(ValueError) as excinfo:
+            orchestrator.create_story(make_request())
+
+    assert str(excinfo.value) == message
+    assert isinstance(excinfo.value.__cause__, RuntimeError)
+    assert log_message in caplog.text
+
+
+def test_document_stage_wraps_unexpected_errors(monkeypatch, caplog):
+    def broken_pipeline(self, payload, job_request):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(StoryOrchestrator, "_run_document_pipeline", broken_pipeline)
+    orchestrator = make_orchestrator(StubLanguageModel())
+
+    with caplog.at_level(logging.ERROR, logger="app.services.orchestrator"):
+        with pytest.raises(ValueError, match="^Document processing failed: boom$"):
+            orchestrator.create_story(make_request())
+    assert "Document intelligence pipeline failed: boom" in caplog.text
+
+
+def test_document_stage_keeps_validation_errors_unchanged(monkeypatch):
+    def rejecting_pipeline(self, payload, job_request):
+        raise ValueError("CRITICAL ERROR: No content extracted")
+
+    monkeypatch.setattr(StoryOrchestrator, "_run_document_pipeline", rejecting_pipeline)
+    orchestrator = make_orchestrator(StubLanguageModel())
+
+    with pytest.raises(ValueError, match="^CRITICAL ERROR: No content extracted$"):
+        orchestrator.create_story(make_request())
+
+
+def test_analysis_stage_covers_applying_the_analysis(monkeypatch):
+    def broken_apply(self, doc_insights, analysis):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(StoryOrchestrator, "_apply_analysis", broken_apply)
+    orchestrator = make_orchestrator(StubLanguageModel())
+
+    with pytest.raises(ValueError, match="^Analysis failed: boom$"):
+        orchestrator.create_story(make_request())
@@ -71,3 +71,29 @@ def test_prompt_selection_invalid_category_raises():
             keywords=[],
         )
 
+
+
+def test_prompt_selection_controller_reuses_rendered_prompt_for_repeat_inputs():
+    class CountingService(DefaultPromptTemplateService):
+        calls = 0
+
+        def get_prompt(self, **kwargs):
+            CountingService.calls += 1
+            return super().get_prompt(**kwargs)
+
+    controller = PromptSelectionController(CountingService())
+    analysis = AnalysisReport(narrative_summary="Rates held steady.")
+
+    first = controller.select_prompt(
+        mode="news", category="News", language="en-IN", analysis=analysis, keywords=["economy"]
+    )
+    second = controller.select_prompt(
+        mode="news", category="News", language="en-IN", analysis=analysis, keywords=["economy"]
+    )
+    third = controller.select_prompt(
+        mode="news", category="News", language="hi-IN", analysis=analysis, keywords=["economy"]
+    )
+
+    assert second is first
+    assert third.metadata["language"] == "hi-IN"
+    assert CountingService.calls == 2
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from app.services.smart_input_detector import SmartInputDetector
+
+
+def test_detect_splits_urls_from_remaining_text():
+    detector = SmartInputDetector()
+
+    input_type, data = detector.detect("Summarise https://example.com/a-story and www.news.org/today please")
+
+    assert input_type == "mixed"
+    assert data["urls"] == ["https://example.com/a-story", "https://www.news.org/today"]
+    assert data["text"] == "Summarise and please"
+
+
+def test_extract_urls_does_not_rematch_inside_an_existing_url():
+    detector = SmartInputDetector()
+
+    urls = detector._extract_urls("http://news.site.org/x.html https://localhost:8000/page.html example.in/path")
+
+    assert urls == [
+        "http://news.site.org/x.html",
+        "https://localhost:8000/page.html",
+        "https://example.in/path",
+    ]
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from app.services.template_slide_generators import SlideSpec, get_slide_generator
+
+
+def test_generate_deck_matches_joined_generate_slide_output():
+    generator = get_slide_generator("https://example.com/templates/test-news-1.html")
+    slides = [
+        SlideSpec(paragraph="Markets <rally> & close", audio_url="https://cdn.example.com/1.mp3", slide_id="slide-1"),
+        SlideSpec(
+            paragraph="Second slide",
+            audio_url="https://cdn.example.com/2.mp3",
+            background_image_url="https://cdn.example.com/bg.png",
+            slide_id="slide-2",
+        ),
+    ]
+
+    deck = generator.generate_deck(slides)
+
+    assert deck == "\n".join(generator.generate_slide(*slide) for slide in slides)
+    assert "Markets &lt;rally&gt; &amp; close" in deck
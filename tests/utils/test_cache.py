@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from app.utils import LRUCache
+from app.utils import cache as cache_module
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the oldest entry
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_lru_cache_expires_entries_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = LRUCache(4, ttl=10.0)
+    cache.put("key", "value")
+
+    now[0] = 109.0
+    assert cache.get("key") == "value"
+    now[0] = 111.0
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_with_zero_size_stores_nothing():
+    cache = LRUCache(0)
+    cache.put("key", "value")
+
+    assert cache.get("key") is None